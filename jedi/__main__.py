@@ -60,6 +60,35 @@ def _complete():
         print(completions)
 
 
+def _warm_cache():
+    """
+    Parses all the modules of an environment (and Jedi's stubs) and writes
+    them to the parser cache, e.g. to ship a warm cache in a container image.
+    """
+    import argparse
+    import jedi
+    from jedi.api import _warm_parser_cache
+
+    parser = argparse.ArgumentParser(prog='python -m jedi warm-cache')
+    parser.add_argument('--environment', help='The path of a virtualenv or a Python '
+                        'executable, by default the current environment is used.')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='The amount of processes that parse files.')
+    args = parser.parse_args(sys.argv[2:])
+
+    if args.environment is None:
+        environment = jedi.get_default_environment()
+    else:
+        environment = jedi.create_environment(args.environment)
+
+    def progress(path, parsed_count, total_count):
+        if parsed_count % 500 == 0 or parsed_count == total_count:
+            print('Parsed %s/%s files' % (parsed_count, total_count))
+
+    _warm_parser_cache(environment, processes=args.processes, progress_callback=progress)
+    print('Cache directory: %s' % jedi.settings.cache_directory)
+
+
 if len(sys.argv) == 2 and sys.argv[1] == 'repl':
     # don't want to use __main__ only for repl yet, maybe we want to use it for
     # something else. So just use the keyword ``repl`` for now.
@@ -68,5 +97,7 @@ elif len(sys.argv) > 1 and sys.argv[1] == '_linter':
     _start_linter()
 elif len(sys.argv) > 1 and sys.argv[1] == '_complete':
     _complete()
+elif len(sys.argv) > 1 and sys.argv[1] == 'warm-cache':
+    _warm_cache()
 else:
     print('Command not implemented: %s' % sys.argv[1])
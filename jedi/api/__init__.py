@@ -7,10 +7,18 @@ Alternatively, if you don't need a custom function and are happy with printing
 debug messages to stdout, simply call :func:`set_debug_function` without
 arguments.
 """
+import multiprocessing
+import os
 import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
 
 import parso
+from parso.cache import parser_cache
 from parso.python import tree
 
 from jedi._compatibility import cast_path
@@ -22,7 +30,7 @@ from jedi.file_io import KnownContentFileIO
 from jedi.api import classes
 from jedi.api import interpreter
 from jedi.api import helpers
-from jedi.api.helpers import validate_line_column
+from jedi.api.helpers import validate_line_column, new_request
 from jedi.api.completion import Completion, search_in_module
 from jedi.api.keywords import KeywordName
 from jedi.api.environment import InterpreterEnvironment
@@ -42,12 +50,17 @@ from jedi.inference.base_value import ValueSet
 from jedi.inference.value.iterable import unpack_tuple_to_dict
 from jedi.inference.gradual.conversion import convert_names, convert_values
 from jedi.inference.gradual.utils import load_proper_stub_module
+from jedi.inference.gradual import typeshed
 from jedi.inference.utils import to_list
 
 # Jedi uses lots and lots of recursion. By setting this a little bit higher, we
 # can remove some "maximum recursion depth" errors.
 sys.setrecursionlimit(3000)
 
+# Maps (project path, environment executable) to the thread that prefetches the
+# imports of scripts (see settings.prefetch_imports) and its stop event.
+_prefetch_threads = {}
+
 
 class Script:
     """
@@ -117,31 +130,125 @@ class Script:
         self._inference_state = InferenceState(
             project, environment=environment, script_path=self.path
         )
+        # We cannot just use parso, because it doesn't use errors='replace'.
+        code = parso.python_bytes_to_unicode(code, encoding='utf-8', errors='replace')
+        self._code_lines = parso.split_lines(code, keepends=True)
+        self._code = code
+
         debug.speed('init')
-        self._module_node, code = self._inference_state.parse_and_get_code(
-            code=code,
+        # Huge scripts are only parsed completely if it's really needed, see
+        # settings._windowed_file_size.
+        self._cropped_file_size = None
+        if settings._windowed_file_size is not None \
+                and len(code) > settings._windowed_file_size:
+            self._cropped_file_size = 0
+        self._window_line = None
+        self._module_node = self._parse()
+        debug.speed('parsed')
+        if self.path is not None:
+            cache.pin_buffer(self.path)
+
+        cache.clear_time_caches()
+        debug.reset_time()
+
+        self._prefetch_thread = None
+        if settings.prefetch_imports:
+            self._start_prefetching()
+
+    def _parse(self):
+        return self._inference_state.parse(
+            code=self._code,
             path=self.path,
-            use_latest_grammar=path and path.suffix == '.pyi',
+            use_latest_grammar=self.path is not None and self.path.suffix == '.pyi',
             cache=False,  # No disk cache, because the current script often changes.
             diff_cache=settings.fast_parser,
             cache_path=settings.cache_directory,
+            cropped_file_size=self._cropped_file_size,
+            window_line=self._window_line,
         )
-        debug.speed('parsed')
-        self._code_lines = parso.split_lines(code, keepends=True)
-        self._code = code
 
-        cache.clear_time_caches()
-        debug.reset_time()
+    def _set_window(self, line):
+        """
+        Parses the top-level statement on ``line`` completely, if the script
+        is cropped. Is called for every request with a position.
+        """
+        cropped_file_size = self._cropped_file_size
+        if cropped_file_size is None:
+            cropped_file_size = settings._cropped_file_size
+        if len(self._code) > cropped_file_size and line != self._window_line:
+            self._window_line = line
+            self._set_module_node(self._parse())
+
+    def _parse_completely(self):
+        """
+        Is called for requests that need the whole module, e.g. refactorings.
+        """
+        if self._cropped_file_size == 0:
+            self._cropped_file_size = None
+            self._set_module_node(self._parse())
+
+    def _set_module_node(self, module_node):
+        self._module_node = module_node
+        # The module was created for the old tree.
+        self._memoize_method_dct = {}
+
+    def _get_prefetch_key(self):
+        return self._inference_state.project.path, self._inference_state.environment.executable
+
+    def _start_prefetching(self):
+        key = self._get_prefetch_key()
+        running = _prefetch_threads.get(key)
+        if running is not None and running[0].is_alive():
+            # Only one thread prefetches per project and environment. The
+            # modules it parses are also used by the other scripts.
+            return
+
+        stop_event = threading.Event()
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_imports,
+            args=(stop_event,),
+            daemon=True,
+        )
+        _prefetch_threads[key] = self._prefetch_thread, stop_event
+        self._prefetch_thread.start()
+
+    def _stop_prefetching(self):
+        running = _prefetch_threads.get(self._get_prefetch_key())
+        if running is not None:
+            # The prefetching thread would only compete with the request for
+            # the GIL. Later scripts start it again.
+            running[1].set()
+
+    def _prefetch_imports(self, stop_event):
+        # The inference state is not thread-safe, therefore use a separate
+        # one. Only the parser cache is shared.
+        inference_state = InferenceState(
+            self._inference_state.project,
+            environment=self._inference_state.environment,
+            script_path=self.path,
+        )
+        try:
+            imports.prefetch_imports(
+                self._create_module(inference_state).as_context(),
+                stop_event,
+            )
+        except Exception:
+            debug.warning('Prefetching imports failed: %s', traceback.format_exc())
 
     # Cache the module, this is mostly useful for testing, since this shouldn't
     # be called multiple times.
     @cache.memoize_method
     def _get_module(self):
+        if settings.prefetch_imports:
+            self._stop_prefetching()
+        return self._create_module(self._inference_state)
+
+    def _create_module(self, inference_state):
         names = None
         is_package = False
         if self.path is not None:
             import_names, is_p = transform_path_to_dotted(
-                self._inference_state.get_sys_path(add_parent_paths=False),
+                inference_state.get_sys_path(add_parent_paths=False),
                 self.path
             )
             if import_names is not None:
@@ -155,8 +262,8 @@ class Script:
         if self.path is not None and self.path.suffix == '.pyi':
             # We are in a stub file. Try to load the stub properly.
             stub_module = load_proper_stub_module(
-                self._inference_state,
-                self._inference_state.latest_grammar,
+                inference_state,
+                inference_state.latest_grammar,
                 file_io,
                 names,
                 self._module_node
@@ -168,7 +275,7 @@ class Script:
             names = ('__main__',)
 
         module = ModuleValue(
-            self._inference_state, self._module_node,
+            inference_state, self._module_node,
             file_io=file_io,
             string_names=names,
             code_lines=self._code_lines,
@@ -176,7 +283,7 @@ class Script:
         )
         if names[0] not in ('builtins', 'typing'):
             # These modules are essential for Jedi, so don't overwrite them.
-            self._inference_state.module_cache.add(names, ValueSet([module]))
+            inference_state.module_cache.add(names, ValueSet([module]))
         return module
 
     def _get_module_context(self):
@@ -189,6 +296,18 @@ class Script:
             self._inference_state.environment,
         )
 
+    @property
+    def limit_reached(self):
+        """
+        Is ``True`` if an inference limit (see :mod:`jedi.inference.recursion`)
+        was reached during the last request of this script or of the names it
+        returned. The results of that request might be incomplete.
+
+        :rtype: bool
+        """
+        return self._inference_state.execution_recursion_detector.limit_reached
+
+    @new_request
     @validate_line_column
     def complete(self, line=None, column=None, *, fuzzy=False):
         """
@@ -198,7 +317,8 @@ class Script:
         names.
 
         :param fuzzy: Default False. Will return fuzzy completions, which means
-            that e.g. ``ooa`` will match ``foobar``.
+            that e.g. ``ooa`` will match ``foobar``. The best matches come
+            first.
         :return: Completion objects, sorted by name. Normal names appear
             before "private" names that start with ``_`` and those appear
             before magic methods and name mangled names that start with ``__``.
@@ -211,6 +331,7 @@ class Script:
             )
             return completion.complete()
 
+    @new_request
     @validate_line_column
     def infer(self, line=None, column=None, *, only_stubs=False, prefer_stubs=False):
         """
@@ -255,6 +376,7 @@ class Script:
         # the API.
         return helpers.sorted_definitions(set(defs))
 
+    @new_request
     @validate_line_column
     def goto(self, line=None, column=None, *, follow_imports=False, follow_builtin_imports=False,
              only_stubs=False, prefer_stubs=False):
@@ -306,6 +428,7 @@ class Script:
         # Avoid duplicates
         return list(set(helpers.sorted_definitions(defs)))
 
+    @new_request
     def search(self, string, *, all_scopes=False):
         """
         Searches a name in the current file. For a description of how the
@@ -323,7 +446,7 @@ class Script:
     def _search_func(self, string, all_scopes=False, complete=False, fuzzy=False):
         names = self._names(all_scopes=all_scopes)
         wanted_type, wanted_names = helpers.split_search_string(string)
-        return search_in_module(
+        results = search_in_module(
             self._inference_state,
             self._get_module_context(),
             names=names,
@@ -332,7 +455,16 @@ class Script:
             complete=complete,
             fuzzy=fuzzy,
         )
+        if complete and fuzzy:
+            # The best fuzzy matches come first, searches ignore the case.
+            last_name = wanted_names[-1]
+            return sorted(
+                results,
+                key=lambda c: -helpers.fuzzy_score(c.name, last_name, case_insensitive=True)
+            )
+        return results
 
+    @new_request
     def complete_search(self, string, **kwargs):
         """
         Like :meth:`.Script.search`, but completes that string. If you want to
@@ -343,11 +475,13 @@ class Script:
             definitions on the top level of a module level, but also in
             functions and classes.
         :param fuzzy: Default False. Will return fuzzy completions, which means
-            that e.g. ``ooa`` will match ``foobar``.
+            that e.g. ``ooa`` will match ``foobar``. The best matches come
+            first.
         :yields: :class:`.Completion`
         """
         return self._search_func(string, complete=True, **kwargs)
 
+    @new_request
     @validate_line_column
     def help(self, line=None, column=None):
         """
@@ -385,6 +519,7 @@ class Script:
                 return [classes.Name(self._inference_state, name)]
         return []
 
+    @new_request
     @validate_line_column
     def get_references(self, line=None, column=None, **kwargs):
         """
@@ -398,6 +533,7 @@ class Script:
             the current module only.
         :rtype: list of :class:`.Name`
         """
+        self._parse_completely()
 
         def _references(include_builtins=True, scope='project'):
             if scope not in ('project', 'file'):
@@ -415,6 +551,7 @@ class Script:
             return helpers.sorted_definitions(definitions)
         return _references(**kwargs)
 
+    @new_request
     @validate_line_column
     def get_signatures(self, line=None, column=None):
         """
@@ -452,6 +589,7 @@ class Script:
         return [classes.Signature(self._inference_state, signature, call_details)
                 for signature in definitions.get_signatures()]
 
+    @new_request
     @validate_line_column
     def get_context(self, line=None, column=None):
         """
@@ -494,6 +632,7 @@ class Script:
         return definition
 
     def _analysis(self):
+        self._parse_completely()
         self._inference_state.is_analysis = True
         self._inference_state.analysis_modules = [self._module_node]
         module = self._get_module_context()
@@ -527,6 +666,7 @@ class Script:
         finally:
             self._inference_state.is_analysis = False
 
+    @new_request
     def get_names(self, **kwargs):
         """
         Returns names defined in the current file.
@@ -548,9 +688,11 @@ class Script:
 
         :rtype: list of :class:`.SyntaxError`
         """
+        self._parse_completely()
         return parso_to_jedi_errors(self._inference_state.grammar, self._module_node)
 
     def _names(self, all_scopes=False, definitions=True, references=False):
+        self._parse_completely()
         # Set line/column to a random position, because they don't matter.
         module_context = self._get_module_context()
         defs = [
@@ -564,6 +706,7 @@ class Script:
         ]
         return sorted(defs, key=lambda x: x.start_pos)
 
+    @new_request
     def rename(self, line=None, column=None, *, new_name):
         """
         Renames all references of the variable under the cursor.
@@ -576,6 +719,7 @@ class Script:
         definitions = self.get_references(line, column, include_builtins=False)
         return refactoring.rename(self._inference_state, definitions, new_name)
 
+    @new_request
     @validate_line_column
     def extract_variable(self, line, column, *, new_name, until_line=None, until_column=None):
         """
@@ -610,11 +754,13 @@ class Script:
             if until_column is None:
                 until_column = len(self._code_lines[until_line - 1])
             until_pos = until_line, until_column
+        self._parse_completely()
         return extract_variable(
             self._inference_state, self.path, self._module_node,
             new_name, (line, column), until_pos
         )
 
+    @new_request
     @validate_line_column
     def extract_function(self, line, column, *, new_name, until_line=None, until_column=None):
         """
@@ -657,11 +803,13 @@ class Script:
             if until_column is None:
                 until_column = len(self._code_lines[until_line - 1])
             until_pos = until_line, until_column
+        self._parse_completely()
         return extract_function(
             self._inference_state, self.path, self._get_module_context(),
             new_name, (line, column), until_pos
         )
 
+    @new_request
     def inline(self, line=None, column=None):
         """
         Inlines a variable under the cursor. This is basically the opposite of
@@ -740,17 +888,115 @@ class Interpreter(Script):
         )
 
 
-def preload_module(*modules):
+def preload_module(*modules, progress_callback=None, processes=None):
     """
     Preloading modules tells Jedi to load a module now, instead of lazy parsing
     of modules. This can be useful for IDEs, to control which modules to load
     on startup.
 
     :param modules: different module names, list of string.
+    :param progress_callback: Is called with ``(module_name, loaded_count,
+        total_count, seconds)`` after each module was loaded.
+    :param processes: If this is larger than one, the modules are first loaded
+        in that many processes. This fills the parser cache in
+        :data:`jedi.settings.cache_directory`, which makes loading the modules
+        in this process a lot faster. Every module is then loaded (and passed
+        to ``progress_callback``) twice.
+
+    .. note:: The processes are spawned, which means that they import the
+        ``__main__`` module of your program again. Scripts that use
+        ``processes`` therefore need an ``if __name__ == '__main__':`` guard.
     """
+    total_count = len(modules)
+    loaded_count = 0
+    if processes is not None and processes > 1 and len(modules) > 1:
+        total_count *= 2
+        # Forking would share the pipes to the compiled subprocesses with the
+        # children, therefore start fresh processes.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(min(processes, len(modules)), context) as executor:
+            futures = {
+                executor.submit(_preload_in_subprocess, m, settings.cache_directory): m
+                for m in modules
+            }
+            # Only the cache on disk is interesting, the modules are loaded
+            # again below.
+            for future in as_completed(futures):
+                seconds = future.result()
+                loaded_count += 1
+                if progress_callback is not None:
+                    progress_callback(futures[future], loaded_count, total_count, seconds)
+
     for m in modules:
-        s = "import %s as x; x." % m
-        Script(s).complete(1, len(s))
+        start = time.perf_counter()
+        _preload_module(m)
+        loaded_count += 1
+        if progress_callback is not None:
+            progress_callback(m, loaded_count, total_count, time.perf_counter() - start)
+
+
+def _preload_module(module_name):
+    s = "import %s as x; x." % module_name
+    Script(s).complete(1, len(s))
+
+
+def _preload_in_subprocess(module_name, cache_directory):
+    settings.cache_directory = cache_directory
+    start = time.perf_counter()
+    _preload_module(module_name)
+    return time.perf_counter() - start
+
+
+def _warm_parser_cache(environment, processes=None, progress_callback=None):
+    """
+    Parses all Python files on the sys path of an environment and the stubs
+    that are shipped with Jedi in multiple processes. The results are only
+    written to parso's cache in :data:`jedi.settings.cache_directory`.
+
+    :param progress_callback: Is called with ``(path, parsed_count,
+        total_count)`` after each file.
+    """
+    inference_state = InferenceState(get_default_project(), environment=environment)
+    jobs = {}
+
+    def add_files(directory, suffixes, grammar):
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if d != '__pycache__']
+            for filename in filenames:
+                if filename.endswith(suffixes):
+                    jobs.setdefault(os.path.join(root, filename), grammar.version_info)
+
+    for path in environment.get_sys_path():
+        if os.path.isdir(path):
+            add_files(path, ('.py',), inference_state.grammar)
+            add_files(path, ('.pyi',), inference_state.latest_grammar)
+    add_files(typeshed.TYPESHED_PATH, ('.pyi',), inference_state.latest_grammar)
+    add_files(typeshed.DJANGO_INIT_PATH.parent.parent, ('.pyi',),
+              inference_state.latest_grammar)
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(processes, context) as executor:
+        results = executor.map(
+            _parse_to_cache, jobs.keys(), jobs.values(),
+            repeat(settings.cache_directory),
+            chunksize=64,
+        )
+        for i, path in enumerate(jobs, 1):
+            next(results)
+            if progress_callback is not None:
+                progress_callback(path, i, len(jobs))
+
+
+def _parse_to_cache(path, version_info, cache_directory):
+    grammar = parso.load_grammar(version='%s.%s' % version_info[:2])
+    try:
+        grammar.parse(path=path, cache=True, cache_path=cache_directory)
+    except Exception:
+        # Files with encoding issues and the like are parsed again on demand.
+        pass
+    # Only the cache on disk is interesting, don't keep all the modules in
+    # memory.
+    parser_cache.get(grammar._hashed, {}).pop(path, None)
 
 
 def set_debug_function(func_cb=debug.print_to_stdout, warnings=True,
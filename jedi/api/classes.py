@@ -30,7 +30,7 @@ from jedi.inference.gradual.conversion import convert_names, convert_values
 from jedi.inference.base_value import ValueSet
 from jedi.api.keywords import KeywordName
 from jedi.api import completion_cache
-from jedi.api.helpers import filter_follow_imports
+from jedi.api.helpers import filter_follow_imports, new_request
 
 
 def _sort_names_by_start_pos(names):
@@ -261,6 +261,7 @@ class BaseName:
             return last_leaf.end_pos
         return definition.end_pos
 
+    @new_request
     def docstring(self, raw=False, fast=True):
         r"""
         Return a document string for this completion object.
@@ -420,6 +421,7 @@ class BaseName:
             return False
         return tree_name.is_definition() and tree_name.parent.type == 'trailer'
 
+    @new_request
     @debug.increase_indent_cm('goto on name')
     def goto(self, *, follow_imports=False, follow_builtin_imports=False,
              only_stubs=False, prefer_stubs=False):
@@ -450,6 +452,7 @@ class BaseName:
         return [self if n == self._name else Name(self._inference_state, n)
                 for n in names]
 
+    @new_request
     @debug.increase_indent_cm('infer on name')
     def infer(self, *, only_stubs=False, prefer_stubs=False):
         """
@@ -566,6 +569,7 @@ class BaseName:
         names = convert_names([self._name], prefer_stubs=True)
         return [sig for name in names for sig in name.infer().get_signatures()]
 
+    @new_request
     def get_signatures(self):
         """
         Returns all potential signatures for a function or a class. Multiple
@@ -578,6 +582,7 @@ class BaseName:
             for s in self._get_signatures()
         ]
 
+    @new_request
     def execute(self):
         """
         Uses type inference to "execute" this identifier and returns the
@@ -587,6 +592,7 @@ class BaseName:
         """
         return _values_to_definitions(self._name.infer().execute_with_values())
 
+    @new_request
     def get_type_hint(self):
         """
         Returns type hints like ``Iterable[int]`` or ``Union[int, str]``.
@@ -751,6 +757,7 @@ class Name(BaseName):
         super().__init__(inference_state, definition)
 
     @memoize_method
+    @new_request
     def defined_names(self):
         """
         List sub-definitions (e.g., methods in class).
@@ -857,6 +864,7 @@ class Signature(BaseSignature):
 
 
 class ParamName(Name):
+    @new_request
     def infer_default(self):
         """
         Returns default values like the ``1`` of ``def foo(x=1):``.
@@ -865,6 +873,7 @@ class ParamName(Name):
         """
         return _values_to_definitions(self._name.infer_default())
 
+    @new_request
     def infer_annotation(self, **kwargs):
         """
         :param execute_annotation: Default True; If False, values are not
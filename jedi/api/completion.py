@@ -10,10 +10,12 @@ from parso import split_lines
 from jedi import debug
 from jedi import settings
 from jedi.api import classes
+from jedi.api import completion_cache
 from jedi.api import helpers
 from jedi.api import keywords
 from jedi.api.strings import complete_dict
 from jedi.api.file_name import complete_file_name
+from jedi.cache import modification_cache
 from jedi.inference import imports
 from jedi.inference.base_value import ValueSet
 from jedi.inference.helpers import infer_call_of_leaf, parse_dotted_names
@@ -92,6 +94,48 @@ def filter_names(inference_state, completion_names, stack, like_name, fuzzy, cac
                 yield new
 
 
+class _TrailerCompletions:
+    """
+    The unfiltered names of a trailer completion like ``foo.``. While the user
+    is typing the name after the dot, only the names that matched the last
+    (shorter) name are filtered again.
+    """
+    def __init__(self, cached_name, names):
+        self.cached_name = cached_name
+        self._names = names
+        self._last_filter = None
+
+    def get_module_paths(self):
+        return {
+            path
+            for path in (n.parent_context.get_root_context().py__file__() for n in self._names)
+            if path is not None
+        }
+
+    def filter(self, like_name, fuzzy):
+        case_insensitive = settings.case_insensitive_completion
+        if case_insensitive:
+            like_name = like_name.lower()
+
+        names = self._names
+        if self._last_filter is not None:
+            last_like_name, last_flags, last_names = self._last_filter
+            # Both normal and fuzzy matches of a name also match all of its
+            # prefixes.
+            if last_flags == (fuzzy, case_insensitive) and like_name.startswith(last_like_name):
+                names = last_names
+
+        filtered = []
+        for name in names:
+            string = name.string_name
+            if case_insensitive:
+                string = string.lower()
+            if helpers.match(string, like_name, fuzzy=fuzzy):
+                filtered.append(name)
+        self._last_filter = like_name, (fuzzy, case_insensitive), filtered
+        return filtered
+
+
 def _remove_duplicates(completions, other_completions):
     names = {d.name for d in other_completions}
     return [c for c in completions if c.name not in names]
@@ -175,11 +219,19 @@ class Completion:
         return (
             # Removing duplicates mostly to remove False/True/None duplicates.
             _remove_duplicates(prefixed_completions, completions)
-            + sorted(completions, key=lambda x: (x.name.startswith('__'),
-                                                 x.name.startswith('_'),
-                                                 x.name.lower()))
+            + sorted(completions, key=self._get_sort_key)
         )
 
+    def _get_sort_key(self, completion):
+        name = completion.name
+        key = (name.startswith('__'), name.startswith('_'), name.lower())
+        if self._fuzzy:
+            # The best fuzzy matches come first.
+            score = helpers.fuzzy_score(name, self._like_name,
+                                        settings.case_insensitive_completion)
+            return (-score,) + key
+        return key
+
     def _complete_python(self, leaf):
         """
         Analyzes the current context of a completion and decides what to
@@ -277,8 +329,9 @@ class Completion:
                 )
             elif nonterminals[-1] in ('trailer', 'dotted_name') and nodes[-1] == '.':
                 dot = self._module_node.get_leaf_for_position(self._position)
-                cached_name, n = self._complete_trailer(dot.get_previous_leaf())
-                completion_names += n
+                trailer_completions = self._get_trailer_completions(dot.get_previous_leaf())
+                cached_name = trailer_completions.cached_name
+                completion_names += trailer_completions.filter(self._like_name, self._fuzzy)
             elif self._is_parameter_completion():
                 completion_names += self._complete_params(leaf)
             else:
@@ -376,6 +429,35 @@ class Completion:
             completion_names += filter.values()
         return completion_names
 
+    @modification_cache(maxsize=20, time_add_setting="completion_cache_validity")
+    def _get_trailer_completions(self, previous_leaf):
+        """
+        Typing ``foo.ba`` after ``foo.b`` creates a new Script, but the names
+        of ``foo`` don't change. This function calculates the cache key. All
+        the code apart from the name that is typed is part of it, other
+        changes are noticed if the modules the names come from are modified
+        or when the names expire.
+        """
+        module_path = self._module_context.py__file__()
+        if module_path is None:
+            yield None  # Don't cache!
+        else:
+            line_index = self._position[0] - 1
+            code_lines = self._code_lines
+            yield (
+                module_path,
+                self._inference_state.environment,
+                self._inference_state.project.path,
+                ''.join(code_lines[:line_index]) + code_lines[line_index][:self._position[1]],
+                code_lines[line_index][self._original_position[1]:]
+                + ''.join(code_lines[line_index + 1:]),
+            )
+        trailer_completions = _TrailerCompletions(*self._complete_trailer(previous_leaf))
+        yield trailer_completions
+        # The names belong to the inference state of an older script. They
+        # are fine to use, as long as the modules they are from don't change.
+        yield trailer_completions.get_module_paths() - {module_path}
+
     def _complete_trailer(self, previous_leaf):
         inferred_context = self._module_context.create_context(previous_leaf)
         values = infer_call_of_leaf(inferred_context, previous_leaf)
@@ -390,7 +472,11 @@ class Completion:
                 if len(v.string_names) == 1:
                     module_name = v.string_names[0]
                     if module_name in ('numpy', 'tensorflow', 'matplotlib', 'pandas'):
-                        cached_name = module_name
+                        cached_name = completion_cache.create_module_key(
+                            module_name,
+                            v.py__file__(),
+                            self._inference_state.environment,
+                        )
 
         return cached_name, self._complete_trailer_for_values(values)
 
@@ -1,27 +1,109 @@
+"""
+The types and docstrings of completions of huge modules like numpy are slow
+to infer. They are therefore cached in memory for the most recently used
+modules. If :data:`jedi.settings.save_completion_cache` is set, they are also
+saved in :data:`jedi.settings.cache_directory` for other processes.
+
+The cache key contains the modification time of the module and the Python
+environment, so the cache is not used anymore if a module is upgraded.
+"""
+import hashlib
+import os
 from typing import Dict, Tuple, Callable
 
+from jedi import debug
+from jedi import settings
+from jedi.cache import PickleLog
+
 CacheValues = Tuple[str, str, str]
 CacheValuesCallback = Callable[[], CacheValues]
 
+_VERSION = 2
+_MAX_MODULES = 10
+_MAX_FILE_SIZE = 10 * 1024 * 1024
 
 _cache: Dict[str, Dict[str, CacheValues]] = {}
 
 
-def save_entry(module_name: str, name: str, cache: CacheValues) -> None:
+def create_module_key(module_name: str, module_path, environment) -> str:
+    """
+    Returns the key of a module, which changes if the module or the
+    environment change. It consists of the module name, a hash of the module's
+    location and a hash of its version.
+    """
+    try:
+        modified = os.path.getmtime(module_path)
+    except (OSError, TypeError):
+        modified = None
+    location = repr((str(module_path), environment.executable))
+    version = repr((modified, tuple(environment.version_info)))
+    return '-'.join([
+        module_name,
+        hashlib.sha256(location.encode('utf-8')).hexdigest()[:16],
+        hashlib.sha256(version.encode('utf-8')).hexdigest()[:16],
+    ])
+
+
+def _get_cache_folder() -> str:
+    return os.path.join(settings.cache_directory, 'completions-%s' % _VERSION)
+
+
+def _get_pickle_log(module_key: str) -> PickleLog:
+    return PickleLog(os.path.join(_get_cache_folder(), module_key + '.pkl'), _MAX_FILE_SIZE)
+
+
+def _remove_old_versions(module_key: str) -> None:
+    """
+    Removes the files of the same module in the same location, but of older
+    versions (e.g. before numpy was upgraded).
+    """
+    prefix = module_key.rsplit('-', 1)[0] + '-'
+    try:
+        file_names = os.listdir(_get_cache_folder())
+    except OSError:
+        return
+    for file_name in file_names:
+        if file_name.startswith(prefix) and file_name != module_key + '.pkl':
+            try:
+                os.remove(os.path.join(_get_cache_folder(), file_name))
+            except OSError:
+                debug.warning('Could not remove the completion cache %s', file_name)
+
+
+def _load_module_cache(module_key: str) -> Dict[str, CacheValues]:
+    if not settings.save_completion_cache:
+        return {}
+    pickle_log = _get_pickle_log(module_key)
+    if not os.path.exists(pickle_log.path):
+        _remove_old_versions(module_key)
+    return pickle_log.load()
+
+
+def _get_module_cache(module_key: str) -> Dict[str, CacheValues]:
     try:
-        module_cache = _cache[module_name]
+        module_cache = _cache.pop(module_key)
     except KeyError:
-        module_cache = _cache[module_name] = {}
-    module_cache[name] = cache
+        module_cache = _load_module_cache(module_key)
+    # The most recently used modules are at the end.
+    _cache[module_key] = module_cache
+    if len(_cache) > _MAX_MODULES:
+        del _cache[next(iter(_cache))]
+    return module_cache
+
+
+def save_entry(module_key: str, name: str, cache: CacheValues) -> None:
+    _get_module_cache(module_key)[name] = cache
+    if settings.save_completion_cache:
+        _get_pickle_log(module_key).append(name, cache)
 
 
 def _create_get_from_cache(number: int) -> Callable[[str, str, CacheValuesCallback], str]:
-    def _get_from_cache(module_name: str, name: str, get_cache_values: CacheValuesCallback) -> str:
+    def _get_from_cache(module_key: str, name: str, get_cache_values: CacheValuesCallback) -> str:
         try:
-            return _cache[module_name][name][number]
+            return _get_module_cache(module_key)[name][number]
         except KeyError:
             v = get_cache_values()
-            save_entry(module_name, name, v)
+            save_entry(module_key, name, v)
             return v[number]
     return _get_from_cache
 
@@ -5,7 +5,7 @@ import re
 from collections import namedtuple
 from textwrap import dedent
 from itertools import chain
-from functools import wraps
+from functools import wraps, lru_cache
 from inspect import Parameter
 
 from parso.python.parser import Parser
@@ -15,7 +15,7 @@ from jedi.inference.base_value import NO_VALUES
 from jedi.inference.syntax_tree import infer_atom
 from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.compiled import get_string_value_set
-from jedi.cache import signature_time_cache, memoize_method
+from jedi.cache import modification_cache, memoize_method
 from jedi.parser_utils import get_parent_scope
 
 
@@ -26,13 +26,59 @@ def _start_match(string, like_name):
     return string.startswith(like_name)
 
 
+@lru_cache(maxsize=2 ** 14)
+def _get_char_mask(string):
+    """
+    Returns a bitmask of the characters in a string. While a name is typed,
+    every keystroke matches it against the same names of a scope.
+    """
+    mask = 0
+    for char in string:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
 def _fuzzy_match(string, like_name):
-    if len(like_name) <= 1:
-        return like_name in string
-    pos = string.find(like_name[0])
-    if pos >= 0:
-        return _fuzzy_match(string[pos + 1:], like_name[1:])
-    return False
+    # Most names don't match, which is usually visible from the characters
+    # they contain.
+    if _get_char_mask(like_name) & ~_get_char_mask(string):
+        return False
+    pos = 0
+    for char in like_name:
+        pos = string.find(char, pos) + 1
+        if not pos:
+            return False
+    return True
+
+
+def fuzzy_score(string, like_name, case_insensitive=False):
+    """
+    Returns how well ``like_name`` fuzzy matches ``string`` (higher is
+    better) or None if it doesn't match at all. Characters that start the
+    string or a part of a snake_case or camelCase name and characters that
+    follow each other score higher.
+    """
+    lowered = string
+    if case_insensitive:
+        lowered = string.lower()
+        like_name = like_name.lower()
+
+    score = 0
+    pos = 0
+    for char in like_name:
+        index = lowered.find(char, pos)
+        if index == -1:
+            return None
+        if index == 0:
+            score += 3
+        else:
+            before = string[index - 1]
+            if before == '_' or before.islower() and string[index].isupper():
+                score += 2
+            if index == pos:
+                score += 1
+        pos = index + 1
+    return score
 
 
 def match(string, like_name, fuzzy=False):
@@ -444,26 +490,39 @@ def get_signature_details(module, position):
     return None
 
 
-@signature_time_cache("call_signatures_validity")
+@modification_cache(maxsize=20, time_add_setting="call_signatures_validity")
 def cache_signatures(inference_state, context, bracket_leaf, code_lines, user_pos):
-    """This function calculates the cache key."""
-    line_index = user_pos[0] - 1
-
-    before_cursor = code_lines[line_index][:user_pos[1]]
-    other_lines = code_lines[bracket_leaf.start_pos[0]:line_index]
-    whole = ''.join(other_lines + [before_cursor])
-    before_bracket = re.match(r'.*\(', whole, re.DOTALL)
-
+    """
+    This function calculates the cache key. While the arguments of a call are
+    typed, only the code between the bracket and the cursor changes. The
+    callee stays the same until other code or the modules it comes from
+    change.
+    """
     module_path = context.get_root_context().py__file__()
     if module_path is None:
         yield None  # Don't cache!
     else:
-        yield (module_path, before_bracket, bracket_leaf.start_pos)
-    yield infer(
+        bracket_index = bracket_leaf.line - 1
+        line_index = user_pos[0] - 1
+        yield (
+            module_path,
+            inference_state.environment,
+            inference_state.project.path,
+            ''.join(code_lines[:bracket_index]) + code_lines[bracket_index][:bracket_leaf.column],
+            code_lines[line_index][user_pos[1]:] + ''.join(code_lines[line_index + 1:]),
+        )
+    values = infer(
         inference_state,
         context,
         bracket_leaf.get_previous_leaf(),
     )
+    yield values
+    # The current module is part of the key.
+    yield {
+        path
+        for path in (value.get_root_context().py__file__() for value in values)
+        if path is not None and path != module_path
+    }
 
 
 def validate_line_column(func):
@@ -485,10 +544,23 @@ def validate_line_column(func):
             raise ValueError('`column` parameter (%d) is not in a valid range '
                              '(0-%d) for line %d (%r).' % (
                                  column, line_len, line, line_string))
+        self._set_window(line)
         return func(self, line, column, *args, **kwargs)
     return wrapper
 
 
+def new_request(func):
+    """
+    Runs an API method as a request of its own, which means that it gets its
+    own time budget for function executions.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._inference_state.execution_recursion_detector.new_request():
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
 def get_module_names(module, all_scopes, definitions=True, references=False):
     """
     Returns a dictionary with name parts as keys and their call paths as
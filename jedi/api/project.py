@@ -16,6 +16,7 @@ from jedi.api.environment import get_cached_default_environment, create_environm
 from jedi.api.exceptions import WrongVersion
 from jedi.api.completion import search_in_module
 from jedi.api.helpers import split_search_string, get_module_names
+from jedi.api.search_index import get_search_index
 from jedi.inference.imports import load_module_from_path, \
     load_namespace_from_path, iter_module_names
 from jedi.inference.sys_path import discover_buildout_paths
@@ -328,19 +329,24 @@ class Project:
             )
 
         # 2. Search for identifiers in the project.
-        for module_context in search_in_file_ios(inference_state, file_ios, name):
-            names = get_module_names(module_context.tree_node, all_scopes=all_scopes)
-            names = [module_context.create_name(n) for n in names]
-            names = _remove_imports(names)
-            yield from search_in_module(
-                inference_state,
-                module_context,
-                names=names,
-                wanted_type=wanted_type,
-                wanted_names=wanted_names,
-                complete=complete,
-                ignore_imports=True,
-            )
+        search_index = get_search_index(self._path)
+        try:
+            for module_context in search_in_file_ios(inference_state, file_ios, name,
+                                                     search_index=search_index):
+                names = get_module_names(module_context.tree_node, all_scopes=all_scopes)
+                names = [module_context.create_name(n) for n in names]
+                names = _remove_imports(names)
+                yield from search_in_module(
+                    inference_state,
+                    module_context,
+                    names=names,
+                    wanted_type=wanted_type,
+                    wanted_names=wanted_names,
+                    complete=complete,
+                    ignore_imports=True,
+                )
+        finally:
+            search_index.save()
 
         # 3. Search for modules on sys.path
         sys_path = [
@@ -0,0 +1,136 @@
+"""
+Searching a project (see :meth:`.Project.search`) has to find the files that
+contain a name. Reading all the files of a big project for every search is
+slow, so the words of every file are saved in a small bloom filter. Files
+whose filter doesn't contain the name are not read again.
+
+The filters are created while searching, for the files that the search reads
+anyway. Therefore the limits of opened files still apply and big projects are
+indexed over several searches. The filters are saved in
+:data:`jedi.settings.cache_directory`, split into shards by path, so only the
+shards with changed files are saved again.
+"""
+import hashlib
+import os
+import pickle
+import re
+import zlib
+
+from jedi import debug
+from jedi import settings
+
+_VERSION = 2
+_WORD_REGEX = re.compile(rb'\w+')
+# With two bits per word, this makes less than 2% of the filters match words
+# that are not in the file.
+_BITS_PER_WORD = 16
+_MAX_BITS = 2 ** 16
+_SHARD_COUNT = 64
+
+_indexes = {}
+
+
+def _get_bit_positions(word, size):
+    h = zlib.crc32(word)
+    return h & (size - 1), (h >> 16) & (size - 1)
+
+
+def _create_filter(code):
+    words = set(_WORD_REGEX.findall(code))
+    size = 64
+    while size < len(words) * _BITS_PER_WORD and size < _MAX_BITS:
+        size *= 2
+    bits = bytearray(size // 8)
+    for word in words:
+        for position in _get_bit_positions(word, size):
+            bits[position >> 3] |= 1 << (position & 7)
+    return size, int.from_bytes(bits, 'little')
+
+
+def get_search_index(project_path):
+    index_dir = os.path.join(
+        settings.cache_directory,
+        'search_index-%s' % _VERSION,
+        hashlib.sha256(str(project_path).encode('utf-8')).hexdigest(),
+    )
+    try:
+        return _indexes[index_dir]
+    except KeyError:
+        index = _indexes[index_dir] = SearchIndex(index_dir)
+        return index
+
+
+class SearchIndex:
+    def __init__(self, index_dir):
+        self._index_dir = index_dir
+        # Dict[shard number, Dict[path, Tuple[modified, size, bits]]]
+        self._shards = {}
+        self._changed_shards = set()
+
+    def _get_shard(self, path):
+        number = zlib.crc32(path.encode('utf-8', 'surrogateescape')) % _SHARD_COUNT
+        try:
+            return number, self._shards[number]
+        except KeyError:
+            pass
+
+        shard_path = self._get_shard_path(number)
+        try:
+            with open(shard_path, 'rb') as f:
+                shard = pickle.load(f)
+        except FileNotFoundError:
+            shard = {}
+        except Exception:
+            debug.warning('Could not load the search index %s', shard_path)
+            shard = {}
+        self._shards[number] = shard
+        return number, shard
+
+    def _get_shard_path(self, number):
+        return os.path.join(self._index_dir, '%s.pkl' % number)
+
+    def might_contain(self, file_io, name):
+        """
+        Returns False if the file of ``file_io`` doesn't contain ``name`` as a
+        word. Files that are not indexed (or were modified) and non-ASCII
+        names might always contain it.
+        """
+        if not name or not name.isascii():
+            return True
+        path = str(file_io.path)
+        entry = self._get_shard(path)[1].get(path)
+        if entry is None or entry[0] != file_io.get_last_modified():
+            return True
+        _, size, bits = entry
+        mask = sum(1 << p for p in set(_get_bit_positions(name.encode('ascii'), size)))
+        return bits & mask == mask
+
+    def add(self, path, modified, code):
+        """
+        Indexes the bytes of a file that were read while searching.
+        """
+        path = str(path)
+        number, shard = self._get_shard(path)
+        shard[path] = (modified,) + _create_filter(code)
+        self._changed_shards.add(number)
+
+    def save(self):
+        """
+        Saves the changed shards. Files that were removed are removed from
+        those shards as well.
+        """
+        for number in self._changed_shards:
+            shard = self._shards[number]
+            for path in [p for p in shard if not os.path.exists(p)]:
+                del shard[path]
+
+            shard_path = self._get_shard_path(number)
+            tmp_path = shard_path + '.tmp'
+            try:
+                os.makedirs(self._index_dir, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(shard, f, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, shard_path)
+            except OSError:
+                debug.warning('Could not save the search index %s', shard_path)
+        self._changed_shards.clear()
@@ -6,19 +6,32 @@ available:
 - ``time_cache`` can be used to cache something for just a limited time span,
   which can be useful if there's user interaction and the user cannot react
   faster than a certain time.
+- ``PickleLog`` keeps entries in a file that several processes share.
 
 This module is one of the reasons why |jedi| is not thread-safe. As you can see
 there are global variables, which are holding the cache information. Some of
 these variables are being cleaned after every API usage.
 """
+import heapq
+import os
+import pickle
+import struct
+import threading
 import time
 from functools import wraps
-from typing import Any, Dict, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
+from jedi import debug
 from jedi import settings
 from parso.cache import parser_cache
 
-_time_caches: Dict[str, Dict[Any, Tuple[float, Any]]] = {}
+_modification_caches: List[Dict[Any, Tuple[Any, Any, Any]]] = []
+# The paths of the buffers that were used in the latest scripts, the most
+# recent one last. Their modules are not removed by _limit_parser_cache.
+_pinned_paths: Dict[Any, None] = {}
+_PINNED_PATHS_LIMIT = 20
+_RECORD_HEADER = struct.Struct('<I')
 
 
 def clear_time_caches(delete_all: bool = False) -> None:
@@ -28,84 +41,344 @@ def clear_time_caches(delete_all: bool = False) -> None:
     :param delete_all: Deletes also the cache that is normally not deleted,
         like parser cache, which is important for faster parsing.
     """
-    global _time_caches
-
     if delete_all:
-        for cache in _time_caches.values():
+        for cache in _modification_caches:
             cache.clear()
         parser_cache.clear()
-    else:
-        # normally just kill the expired entries, not all
-        for tc in _time_caches.values():
-            # check time_cache for expired entries
-            for key, (t, value) in list(tc.items()):
-                if t < time.time():
-                    # delete expired entries
-                    del tc[key]
+        _pinned_paths.clear()
+    elif settings.parser_cache_size is not None:
+        _limit_parser_cache(settings.parser_cache_size)
+
+
+class TimeCache:
+    """
+    A dictionary whose entries expire. The expiry times are kept in a heap,
+    so removing the expired entries doesn't need to look at all the others.
+    Expired entries are also removed when they are accessed. If there are
+    more than ``maxsize`` entries, the ones that expire first are removed.
+
+    The entries are locked, because imports might be prefetched in another
+    thread (see :data:`jedi.settings.prefetch_imports`).
+    """
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self._dct: Dict[Any, Tuple[float, Any]] = {}
+        # Contains (expiry, counter, key); the counter avoids comparing keys.
+        # There may be outdated entries for keys that were set again.
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = 0
+        self._hits = self._misses = self._expired = self._evicted = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, now: Optional[float] = None) -> Any:
+        """
+        Raises :exc:`KeyError` if there's no entry or if it expired.
+        """
+        with self._lock:
+            try:
+                expiry, value = self._dct[key]
+            except KeyError:
+                self._misses += 1
+                raise
+            if expiry <= (time.time() if now is None else now):
+                del self._dct[key]
+                self._expired += 1
+                self._misses += 1
+                raise KeyError(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Any, value: Any, expiry: float) -> None:
+        with self._lock:
+            self._dct[key] = expiry, value
+            self._counter += 1
+            heapq.heappush(self._heap, (expiry, self._counter, key))
+            if self.maxsize is not None:
+                while len(self._dct) > self.maxsize:
+                    self._pop()
+                    self._evicted += 1
+            if len(self._heap) > 2 * len(self._dct) + 100:
+                # Don't let the outdated entries pile up.
+                self._heap = [
+                    (expiry, i, key)
+                    for i, (key, (expiry, _)) in enumerate(self._dct.items())
+                ]
+                heapq.heapify(self._heap)
+
+    def _pop(self) -> Optional[float]:
+        """
+        Removes the entry that expires first and returns its expiry time.
+        """
+        while self._heap:
+            expiry, _, key = heapq.heappop(self._heap)
+            entry = self._dct.get(key)
+            if entry is not None and entry[0] == expiry:
+                del self._dct[key]
+                return expiry
+        return None
+
+    def remove_expired(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                expiry, _, key = heapq.heappop(heap)
+                entry = self._dct.get(key)
+                if entry is not None and entry[0] == expiry:
+                    del self._dct[key]
+                    self._expired += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dct.clear()
+            self._heap.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of entries, the hits and misses of :meth:`get`,
+        the number of expired entries and the number of entries that were
+        removed, because there were more than ``maxsize``.
+        """
+        return dict(
+            size=len(self._dct),
+            hits=self._hits,
+            misses=self._misses,
+            expired=self._expired,
+            evicted=self._evicted,
+        )
+
+    def __len__(self) -> int:
+        return len(self._dct)
+
+
+def pin_buffer(path: Any) -> None:
+    """
+    Keeps the module of a buffer (e.g. the code of a :class:`.Script`) in
+    parso's parser cache, even if :data:`jedi.settings.parser_cache_size` is
+    reached. Buffers are not saved on disk and their diff parser state would
+    be lost. Only the latest buffers stay pinned.
+    """
+    _pinned_paths.pop(path, None)
+    _pinned_paths[path] = None
+    while len(_pinned_paths) > _PINNED_PATHS_LIMIT:
+        del _pinned_paths[next(iter(_pinned_paths))]
+
+
+def _limit_parser_cache(size: int) -> None:
+    """
+    Removes the least recently used modules from parso's parser cache until
+    only ``size`` modules are left. Modules that were saved on disk are just
+    loaded from there again if they are needed. Pinned buffers are kept.
+    """
+    count = sum(len(path_to_item_map) for path_to_item_map in list(parser_cache.values()))
+    if count <= size:
+        return
+
+    # Iterate over copies, because modules might be parsed in another thread
+    # (see settings.prefetch_imports).
+    items = [
+        (item.last_used, path_to_item_map, path)
+        for path_to_item_map in list(parser_cache.values())
+        for path, item in list(path_to_item_map.items())
+        if path not in _pinned_paths
+    ]
+    for _, path_to_item_map, path in heapq.nsmallest(count - size, items, key=itemgetter(0)):
+        path_to_item_map.pop(path, None)
+
+
+def get_modification_time(path):
+    """
+    Returns the modification time of a file or None if it doesn't exist.
+    """
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
 
-def signature_time_cache(time_add_setting):
+def modification_cache(maxsize, time_add_setting=None):
     """
-    This decorator works as follows: Call it with a setting and after that
-    use the function with a callable that returns the key.
-    But: This function is only called if the key is not available. After a
-    certain amount of time (`time_add_setting`) the cache is invalid.
+    This decorator works as follows: The decorated function yields the key,
+    the value and then the paths of the files the value depends on. The
+    value is only calculated if the key is not available. It is valid as
+    long as the files it depends on are not modified. Only the last
+    ``maxsize`` keys are kept.
+
+    If ``time_add_setting`` is given, values also expire after that many
+    seconds (the value of the setting). Expired values are removed when
+    they are accessed or when there are more than ``maxsize`` keys.
 
     If the given key is None, the function will not be cached.
     """
     def _temp(key_func):
         dct = {}
-        _time_caches[time_add_setting] = dct
+        _modification_caches.append(dct)
 
         def wrapper(*args, **kwargs):
             generator = key_func(*args, **kwargs)
             key = next(generator)
             try:
-                expiry, value = dct[key]
-                if expiry > time.time():
-                    return value
+                expiry, modification_times, value = dct.pop(key)
             except KeyError:
                 pass
+            else:
+                if (expiry is None or time.time() < expiry) \
+                        and all(get_modification_time(path) == t
+                                for path, t in modification_times):
+                    # Move the key to the end, it was used recently.
+                    dct[key] = expiry, modification_times, value
+                    return value
 
             value = next(generator)
-            time_add = getattr(settings, time_add_setting)
             if key is not None:
-                dct[key] = time.time() + time_add, value
+                modification_times = [
+                    (path, get_modification_time(path)) for path in next(generator)
+                ]
+                expiry = None
+                if time_add_setting is not None:
+                    expiry = time.time() + getattr(settings, time_add_setting)
+                dct[key] = expiry, modification_times, value
+                if len(dct) > maxsize:
+                    del dct[next(iter(dct))]
             return value
         return wrapper
     return _temp
 
 
-def time_cache(seconds):
+def time_cache(seconds, maxsize=None):
     def decorator(func):
-        cache = {}
+        cache = TimeCache(maxsize)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
             key = (args, frozenset(kwargs.items()))
             try:
-                created, result = cache[key]
-                if time.time() < created + seconds:
-                    return result
+                return cache.get(key)
             except KeyError:
                 pass
             result = func(*args, **kwargs)
-            cache[key] = time.time(), result
+            cache.set(key, result, time.time() + seconds)
             return result
 
-        wrapper.clear_cache = lambda: cache.clear()
+        wrapper.clear_cache = cache.clear
+        wrapper.get_cache_stats = cache.get_stats
         return wrapper
 
     return decorator
 
 
+class PickleLog:
+    """
+    A file of pickled ``(key, value)`` records that several processes share.
+    Records are only appended, so processes don't overwrite each other's
+    entries. Every record is prefixed with its length, so a broken record is
+    just skipped. A record that was not written completely (e.g. because a
+    process was killed) is cut off, so the records appended after it can be
+    read again.
+
+    If the file is bigger than ``max_size`` when it's loaded, it is written
+    again without the outdated records of a key. If that's still more than
+    half of ``max_size``, the oldest records are left away.
+    """
+    def __init__(self, path: str, max_size: int) -> None:
+        self.path = path
+        self.max_size = max_size
+
+    def load(self) -> Dict[Any, Any]:
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return {}
+        except OSError:
+            debug.warning('Could not load the cache %s', self.path)
+            return {}
+
+        # Dict[key, Tuple[value, size of the record]]
+        records = {}
+        position = 0
+        while position + _RECORD_HEADER.size <= len(data):
+            length, = _RECORD_HEADER.unpack_from(data, position)
+            start = position + _RECORD_HEADER.size
+            if start + length > len(data):
+                break
+            try:
+                key, value = pickle.loads(data[start:start + length])
+            except Exception:
+                debug.warning('Skipped a broken record in the cache %s', self.path)
+            else:
+                records.pop(key, None)
+                records[key] = value, _RECORD_HEADER.size + length
+            position = start + length
+
+        if len(data) > self.max_size:
+            self._compact(records)
+        elif position < len(data):
+            try:
+                with open(self.path, 'r+b') as f:
+                    f.truncate(position)
+            except OSError:
+                debug.warning('Could not repair the cache %s', self.path)
+        return {key: value for key, (value, _) in records.items()}
+
+    def _compact(self, records: Dict[Any, Tuple[Any, int]]) -> None:
+        size = sum(record_size for _, record_size in records.values())
+        for key in list(records):
+            if size <= self.max_size // 2:
+                break
+            size -= records.pop(key)[1]
+
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                for key, (value, _) in records.items():
+                    f.write(self._dump(key, value))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            debug.warning('Could not compact the cache %s', self.path)
+
+    def _dump(self, key: Any, value: Any) -> bytes:
+        record = pickle.dumps((key, value), pickle.HIGHEST_PROTOCOL)
+        return _RECORD_HEADER.pack(len(record)) + record
+
+    def append(self, key: Any, value: Any) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # A single write, so that records of different processes are
+            # not mixed.
+            with open(self.path, 'ab') as f:
+                f.write(self._dump(key, value))
+        except OSError:
+            debug.warning('Could not save the cache %s', self.path)
+
+
 def memoize_method(method):
-    """A normal memoize function."""
+    """
+    A normal memoize function.
+
+    The results are stored in the attribute ``_memoize_method_dct`` of the
+    instance. Classes that use ``__slots__`` therefore need to define that
+    slot.
+    """
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        cache_dict = self.__dict__.setdefault('_memoize_method_dct', {})
-        dct = cache_dict.setdefault(method, {})
-        key = (args, frozenset(kwargs.items()))
+        try:
+            # Use object.__getattribute__ to avoid calling __getattr__ on
+            # wrappers, which would recurse for unset slots.
+            cache_dict = object.__getattribute__(self, '_memoize_method_dct')
+        except AttributeError:
+            cache_dict = self._memoize_method_dct = {}
+        dct = cache_dict.get(method)
+        if dct is None:
+            dct = cache_dict[method] = {}
+        # Most calls don't use keyword arguments, so avoid creating a
+        # frozenset for them. The key always has two parts, so the keys of
+        # calls with and without keyword arguments can't be equal.
+        if kwargs:
+            key = (args, frozenset(kwargs.items()))
+        else:
+            key = (args, None)
         try:
             return dct[key]
         except KeyError:
@@ -64,15 +64,19 @@ class FileIOFolderMixin:
 
 class ZipFileIO(file_io.KnownContentFileIO, FileIOFolderMixin):
     """For .zip and .egg archives"""
-    def __init__(self, path, code, zip_path):
+    def __init__(self, path, code, zip_path, last_modified=None):
         super().__init__(path, code)
         self._zip_path = zip_path
+        # The modification time of the archive when the code was read.
+        self._last_modified = last_modified
 
     def get_last_modified(self):
-        try:
-            return os.path.getmtime(self._zip_path)
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            return None
+        if self._last_modified is None:
+            try:
+                self._last_modified = os.path.getmtime(self._zip_path)
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                return None
+        return self._last_modified
 
 
 class FileIO(file_io.FileIO, FileIOFolderMixin):
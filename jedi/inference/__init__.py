@@ -78,6 +78,7 @@ from jedi.inference.value import ClassValue, FunctionValue
 from jedi.inference.syntax_tree import infer_expr_stmt, \
     check_tuple_assignments, tree_name_to_values
 from jedi.inference.imports import follow_error_node_imports_if_possible
+from jedi.parser_utils import crop_code
 from jedi.plugins import plugin_manager
 
 
@@ -104,6 +105,9 @@ class InferenceState:
         self.access_cache = {}
         self.allow_descriptor_getattr = False
         self.flow_analysis_enabled = True
+        # Is switched off while looking for array additions, see
+        # settings.dynamic_params_for_other_modules.
+        self.dynamic_params_for_other_modules = True
 
         self.reset_recursion_limitations()
 
@@ -179,8 +183,9 @@ class InferenceState:
 
         return helpers.infer_call_of_leaf(context, name)
 
-    def parse_and_get_code(self, code=None, path=None,
-                           use_latest_grammar=False, file_io=None, **kwargs):
+    def parse_and_get_code(self, code=None, path=None, use_latest_grammar=False,
+                           file_io=None, cropped_file_size=None, window_line=None,
+                           **kwargs):
         if path is not None:
             path = str(path)
         if code is None:
@@ -190,8 +195,10 @@ class InferenceState:
         # We cannot just use parso, because it doesn't use errors='replace'.
         code = parso.python_bytes_to_unicode(code, encoding='utf-8', errors='replace')
 
-        if len(code) > settings._cropped_file_size:
-            code = code[:settings._cropped_file_size]
+        if cropped_file_size is None:
+            cropped_file_size = settings._cropped_file_size
+        if len(code) > cropped_file_size:
+            code = crop_code(code, cropped_file_size, window_line)
 
         grammar = self.latest_grammar if use_latest_grammar else self.grammar
         return grammar.parse(code=code, path=path, file_io=file_io, **kwargs), code
@@ -23,6 +23,10 @@ sentinel = object()
 
 
 class HelperValueMixin:
+    # Values are created in large numbers, so they use slots.
+    # ``_memoize_method_dct`` is used by ``jedi.cache.memoize_method``.
+    __slots__ = ('_memoize_method_dct',)
+
     def get_root_context(self):
         value = self
         if value.parent_context is None:
@@ -140,6 +144,8 @@ class Value(HelperValueMixin):
     """
     To be implemented by subclasses.
     """
+    __slots__ = ('inference_state', 'parent_context')
+
     tree_node = None
     # Possible values: None, tuple, list, dict and set. Here to deal with these
     # very important containers.
@@ -355,6 +361,8 @@ class ValueWrapper(_ValueWrapperBase):
 
 
 class TreeValue(Value):
+    __slots__ = ('tree_node',)
+
     def __init__(self, inference_state, parent_context, tree_node):
         super().__init__(inference_state, parent_context)
         self.tree_node = tree_node
@@ -364,6 +372,8 @@ class TreeValue(Value):
 
 
 class ContextualizedNode:
+    __slots__ = ('context', 'node')
+
     def __init__(self, context, node):
         self.context = context
         self.node = node
@@ -405,36 +415,94 @@ def _getitem(value, index_values, contextualized_node):
     return result
 
 
+# Most value sets only contain very few values. Up to this size the values are
+# stored in a tuple, which is a lot cheaper to create than a frozenset.
+_SMALL_SET_SIZE = 4
+
+
+def _to_storage(iterable):
+    values = []
+    for value in iterable:
+        assert not isinstance(value, ValueSet)
+        if value not in values:
+            values.append(value)
+            if len(values) > _SMALL_SET_SIZE:
+                return frozenset(values).union(iterable)
+    return tuple(values)
+
+
 class ValueSet:
-    def __init__(self, iterable):
-        self._set = frozenset(iterable)
-        for value in iterable:
-            assert not isinstance(value, ValueSet)
+    """
+    An immutable set of values. Small sets are stored as a tuple, bigger ones
+    as a frozenset. Which storage is used only depends on the size, which means
+    that equal sets always use the same storage. Like for sets, the order of
+    the values is undefined. There is only one empty ValueSet: ``NO_VALUES``.
+    """
+    __slots__ = ('_set',)
+
+    def __new__(cls, iterable):
+        return cls._from_storage(_to_storage(iterable))
 
     @classmethod
-    def _from_frozen_set(cls, frozenset_):
-        self = cls.__new__(cls)
-        self._set = frozenset_
+    def _from_storage(cls, storage):
+        if not storage:
+            return NO_VALUES
+        self = object.__new__(cls)
+        self._set = storage
         return self
 
+    @classmethod
+    def _from_frozen_set(cls, frozenset_):
+        if len(frozenset_) <= _SMALL_SET_SIZE:
+            return cls._from_storage(tuple(frozenset_))
+        return cls._from_storage(frozenset_)
+
     @classmethod
     def from_sets(cls, sets):
         """
         Used to work with an iterable of set.
         """
-        aggregated = set()
+        first = None
+        aggregated = None
         for set_ in sets:
-            if isinstance(set_, ValueSet):
-                aggregated |= set_._set
+            if not isinstance(set_, ValueSet):
+                set_ = cls(set_)
+            if not set_._set or set_ is first:
+                continue
+            if first is None:
+                first = set_
+            elif aggregated is None:
+                aggregated = set(first._set)
+                aggregated.update(set_._set)
             else:
-                aggregated |= frozenset(set_)
+                aggregated.update(set_._set)
+
+        if aggregated is None:
+            # Avoid creating new sets if there is only one non-empty set.
+            return NO_VALUES if first is None else first
+        if len(aggregated) == len(first._set):
+            return first
         return cls._from_frozen_set(frozenset(aggregated))
 
     def __or__(self, other):
-        return self._from_frozen_set(self._set | other._set)
+        if not other._set or other is self:
+            return self
+        if not self._set:
+            return other
+        if type(self._set) is tuple and type(other._set) is tuple:
+            values = list(self._set)
+            for value in other._set:
+                if value not in values:
+                    values.append(value)
+            if len(values) == len(self._set):
+                return self
+            if len(values) <= _SMALL_SET_SIZE:
+                return self._from_storage(tuple(values))
+            return self._from_storage(frozenset(values))
+        return self._from_frozen_set(frozenset(self._set).union(other._set))
 
     def __and__(self, other):
-        return self._from_frozen_set(self._set & other._set)
+        return self._from_frozen_set(frozenset(self._set).intersection(other._set))
 
     def __iter__(self):
         return iter(self._set)
@@ -453,6 +521,8 @@ class ValueSet:
 
     def __getattr__(self, name):
         def mapper(*args, **kwargs):
+            if len(self._set) == 1:
+                return _as_value_set(getattr(self._set[0], name)(*args, **kwargs))
             return self.from_sets(
                 getattr(value, name)(*args, **kwargs)
                 for value in self._set
@@ -460,18 +530,33 @@ class ValueSet:
         return mapper
 
     def __eq__(self, other):
-        return self._set == other._set
+        if self is other:
+            return True
+        s1 = self._set
+        s2 = other._set
+        if type(s1) is tuple:
+            # Sets with the same size always have the same storage type.
+            return type(s2) is tuple and len(s1) == len(s2) and all(v in s2 for v in s1)
+        return s1 == s2
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self._set)
+        s = self._set
+        if type(s) is tuple:
+            # Needs to be independent of the order of the values.
+            return hash((len(s), sum(hash(v) for v in s)))
+        return hash(s)
 
     def py__class__(self):
         return ValueSet(c.py__class__() for c in self._set)
 
     def iterate(self, contextualized_node=None, is_async=False):
+        if len(self._set) == 1:
+            yield from self._set[0].iterate(contextualized_node, is_async=is_async)
+            return
+
         from jedi.inference.lazy_value import get_merged_lazy_value
         type_iters = [c.iterate(contextualized_node, is_async=is_async) for c in self._set]
         for lazy_values in zip_longest(*type_iters):
@@ -480,22 +565,29 @@ class ValueSet:
             )
 
     def execute(self, arguments):
+        if len(self._set) == 1:
+            c = self._set[0]
+            return _as_value_set(c.inference_state.execute(c, arguments))
         return ValueSet.from_sets(c.inference_state.execute(c, arguments) for c in self._set)
 
     def execute_with_values(self, *args, **kwargs):
+        if len(self._set) == 1:
+            return _as_value_set(self._set[0].execute_with_values(*args, **kwargs))
         return ValueSet.from_sets(c.execute_with_values(*args, **kwargs) for c in self._set)
 
     def goto(self, *args, **kwargs):
         return reduce(add, [c.goto(*args, **kwargs) for c in self._set], [])
 
     def py__getattribute__(self, *args, **kwargs):
+        if len(self._set) == 1:
+            return _as_value_set(self._set[0].py__getattribute__(*args, **kwargs))
         return ValueSet.from_sets(c.py__getattribute__(*args, **kwargs) for c in self._set)
 
     def get_item(self, *args, **kwargs):
         return ValueSet.from_sets(_getitem(c, *args, **kwargs) for c in self._set)
 
     def try_merge(self, function_name):
-        value_set = self.__class__([])
+        value_set = NO_VALUES
         for c in self._set:
             try:
                 method = getattr(c, function_name)
@@ -544,7 +636,14 @@ class ValueSet:
         return type_var_dict
 
 
-NO_VALUES = ValueSet([])
+NO_VALUES = object.__new__(ValueSet)
+NO_VALUES._set = ()
+
+
+def _as_value_set(values):
+    if isinstance(values, ValueSet):
+        return values
+    return ValueSet(values)
 
 
 def iterator_to_value_set(func):
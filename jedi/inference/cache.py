@@ -4,6 +4,7 @@
 - ``CachedMetaClass`` uses ``_memoize_default`` to do the same with classes.
 """
 from functools import wraps
+from operator import attrgetter
 
 from jedi import debug
 
@@ -20,30 +21,35 @@ def _memoize_default(default=_NO_DEFAULT, inference_state_is_first_arg=False,
     don't think, that there is a big speed difference, but there are many cases
     where recursion could happen (think about a = b; b = a).
     """
+    # Decide at decoration time where the cache lives, so the wrapper doesn't
+    # have to check it on every call.
+    if inference_state_is_first_arg or second_arg_is_inference_state:
+        get_cache = attrgetter('memoize_cache')
+    else:
+        get_cache = attrgetter('inference_state.memoize_cache')
+
     def func(function):
         def wrapper(obj, *args, **kwargs):
-            # TODO These checks are kind of ugly and slow.
-            if inference_state_is_first_arg:
-                cache = obj.memoize_cache
-            elif second_arg_is_inference_state:
-                cache = args[0].memoize_cache  # needed for meta classes
-            else:
-                cache = obj.inference_state.memoize_cache
-
-            try:
-                memo = cache[function]
-            except KeyError:
+            # The second arg is needed for meta classes.
+            cache = get_cache(args[0] if second_arg_is_inference_state else obj)
+            memo = cache.get(function)
+            if memo is None:
                 cache[function] = memo = {}
 
-            key = (obj, args, frozenset(kwargs.items()))
-            if key in memo:
-                return memo[key]
+            # Most calls don't use keyword arguments, so avoid creating a
+            # frozenset for them.
+            if kwargs:
+                key = (obj, args, frozenset(kwargs.items()))
             else:
-                if default is not _NO_DEFAULT:
-                    memo[key] = default
-                rv = function(obj, *args, **kwargs)
-                memo[key] = rv
-                return rv
+                key = (obj, args)
+            result = memo.get(key, _NO_DEFAULT)
+            if result is not _NO_DEFAULT:
+                return result
+            if default is not _NO_DEFAULT:
+                memo[key] = default
+            rv = function(obj, *args, **kwargs)
+            memo[key] = rv
+            return rv
         return wrapper
 
     return func
@@ -90,16 +96,18 @@ def inference_state_method_generator_cache():
         @wraps(function)
         def wrapper(obj, *args, **kwargs):
             cache = obj.inference_state.memoize_cache
-            try:
-                memo = cache[function]
-            except KeyError:
+            memo = cache.get(function)
+            if memo is None:
                 cache[function] = memo = {}
 
-            key = (obj, args, frozenset(kwargs.items()))
+            if kwargs:
+                key = (obj, args, frozenset(kwargs.items()))
+            else:
+                key = (obj, args)
 
-            if key in memo:
+            try:
                 actual_generator, cached_lst = memo[key]
-            else:
+            except KeyError:
                 actual_generator = function(obj, *args, **kwargs)
                 cached_lst = []
                 memo[key] = actual_generator, cached_lst
@@ -14,7 +14,7 @@ import subprocess
 import traceback
 import weakref
 from functools import partial
-from threading import Thread
+from threading import Thread, Lock
 
 from jedi._compatibility import pickle_dump, pickle_load
 from jedi import debug
@@ -170,6 +170,9 @@ class CompiledSubprocess:
         self._env_vars = env_vars
         self._inference_state_deletion_queue = queue.deque()
         self._cleanup_callable = lambda: None
+        # Requests and responses must not be interleaved if the subprocess is
+        # used from multiple threads (e.g. when prefetching imports).
+        self._lock = Lock()
 
     def __repr__(self):
         pid = os.getpid()
@@ -233,6 +236,10 @@ class CompiledSubprocess:
         self._cleanup_callable()
 
     def _send(self, inference_state_id, function, args=(), kwargs={}):
+        with self._lock:
+            return self._send_locked(inference_state_id, function, args, kwargs)
+
+    def _send_locked(self, inference_state_id, function, args, kwargs):
         if self.is_crashed:
             raise InternalError("The subprocess %s has crashed." % self._executable)
 
@@ -3,6 +3,7 @@ import os
 import inspect
 import importlib
 import warnings
+import zipfile
 from pathlib import Path
 from zipimport import zipimporter
 from importlib.machinery import all_suffixes
@@ -13,6 +14,9 @@ from jedi import debug
 from jedi import parser_utils
 from jedi.file_io import KnownContentFileIO, ZipFileIO
 
+# Dict[archive path, Tuple[modification time, Dict[name, zipfile.ZipInfo]]]
+_zip_info_cache = {}
+
 
 def get_sys_path():
     return list(map(cast_path, sys.path))
@@ -199,24 +203,63 @@ def _from_loader(loader, string):
     except AttributeError:
         raise ImportError("get_source was not defined on loader")
 
+    if isinstance(loader, zipimporter):
+        archive = cast_path(loader.archive)
+        code, modified = _get_zip_source(archive, module_path)
+        if code is None:
+            return None, is_package
+        return ZipFileIO(module_path, code, Path(archive), modified), is_package
+
     if f is not importlib.machinery.SourceFileLoader.get_source:
-        # Unfortunately we are reading unicode here, not bytes.
-        # It seems hard to get bytes, because the zip importer
-        # logic just unpacks the zip file and returns a file descriptor
-        # that we cannot as easily access. Therefore we just read it as
-        # a string in the cases where get_source was overwritten.
+        # Unfortunately we are reading unicode here, not bytes. Therefore we
+        # just read it as a string in the cases where get_source was
+        # overwritten.
         code = loader.get_source(string)
     else:
         code = _get_source(loader, string)
 
     if code is None:
         return None, is_package
-    if isinstance(loader, zipimporter):
-        return ZipFileIO(module_path, code, Path(cast_path(loader.archive))), is_package
 
     return KnownContentFileIO(module_path, code), is_package
 
 
+def _get_zip_source(archive, path):
+    """
+    Returns the bytes of a file in a zip archive (or None if it doesn't
+    exist) and the modification time of the archive. The list of files of an
+    archive is only read once, until the archive is modified. The archive
+    itself is not kept open, because that would keep a file descriptor per
+    archive and lock it on Windows.
+    """
+    try:
+        modified = os.path.getmtime(archive)
+    except OSError:
+        return None, None
+    try:
+        cached_modified, infos = _zip_info_cache[archive]
+    except KeyError:
+        cached_modified = None
+    if cached_modified != modified:
+        try:
+            with zipfile.ZipFile(archive) as zip_file:
+                infos = {info.filename: info for info in zip_file.infolist()}
+        except (OSError, zipfile.BadZipFile):
+            return None, modified
+        _zip_info_cache[archive] = modified, infos
+
+    name = os.path.relpath(path, archive).replace(os.path.sep, '/')
+    try:
+        info = infos[name]
+    except KeyError:
+        return None, modified
+    try:
+        with zipfile.ZipFile(archive) as zip_file:
+            return zip_file.read(info), modified
+    except (OSError, zipfile.BadZipFile):
+        return None, modified
+
+
 def _get_source(loader, fullname):
     """
     This method is here as a replacement for SourceLoader.get_source. That
@@ -44,6 +44,8 @@ class CheckAttribute:
 
 
 class CompiledValue(Value):
+    __slots__ = ('access_handle',)
+
     def __init__(self, inference_state, access_handle, parent_context=None):
         super().__init__(inference_state, parent_context)
         self.access_handle = access_handle
@@ -287,6 +289,8 @@ class CompiledValue(Value):
 
 
 class CompiledModule(CompiledValue):
+    __slots__ = ()
+
     file_io = None  # For modules
 
     def _as_context(self):
@@ -15,6 +15,7 @@ from jedi import parser_utils
 
 class AbstractContext:
     # Must be defined: inference_state and tree_node and parent_context as an attribute/property
+    __slots__ = ('inference_state', 'predefined_names')
 
     def __init__(self, inference_state):
         self.inference_state = inference_state
@@ -163,6 +164,8 @@ class ValueContext(AbstractContext):
     """
     Should be defined, otherwise the API returns empty types.
     """
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         super().__init__(value.inference_state)
         self._value = value
@@ -217,6 +220,8 @@ class ValueContext(AbstractContext):
 
 
 class TreeContextMixin:
+    __slots__ = ()
+
     def infer_node(self, node):
         from jedi.inference.syntax_tree import infer_node
         return infer_node(self, node)
@@ -297,6 +302,8 @@ class TreeContextMixin:
 
 
 class FunctionContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def get_filters(self, until_position=None, origin_scope=None):
         yield ParserTreeFilter(
             self.inference_state,
@@ -307,6 +314,8 @@ class FunctionContext(TreeContextMixin, ValueContext):
 
 
 class ModuleContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def py__file__(self):
         return self._value.py__file__()
 
@@ -360,6 +369,8 @@ class NamespaceContext(TreeContextMixin, ValueContext):
 
 
 class ClassContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
+
     def get_filters(self, until_position=None, origin_scope=None):
         yield self.get_global_filter(until_position, origin_scope)
 
@@ -372,6 +383,8 @@ class ClassContext(TreeContextMixin, ValueContext):
 
 
 class CompForContext(TreeContextMixin, AbstractContext):
+    __slots__ = ('tree_node', 'parent_context')
+
     def __init__(self, parent_context, comp_for):
         super().__init__(parent_context.inference_state)
         self.tree_node = comp_for
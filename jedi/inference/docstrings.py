@@ -15,13 +15,18 @@ As an addition to parameter searching, this module also provides return
 annotations.
 """
 
+import hashlib
+import os
 import re
 import warnings
+from functools import lru_cache
 from textwrap import dedent
 
 from parso import parse, ParserSyntaxError
 
 from jedi import debug
+from jedi import settings
+from jedi.cache import PickleLog
 from jedi.common import indent_block
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.base_value import iterator_to_value_set, ValueSet, \
@@ -42,19 +47,76 @@ DOCSTRING_RETURN_PATTERNS = [
 
 REST_ROLE_PATTERN = re.compile(r':[^`]+:`([^`]+)`')
 
+_TYPE_STRINGS_CACHE_VERSION = 1
+_MAX_TYPE_STRINGS_CACHE_SIZE = 10 * 1024 * 1024
+_MAX_TYPE_STRINGS = 10000
 
 _numpy_doc_string_cache = None
+# A tuple of the cache directory, the PickleLog and the cached type strings.
+_type_strings_cache = None
 
 
 def _get_numpy_doc_string_cls():
     global _numpy_doc_string_cache
     if isinstance(_numpy_doc_string_cache, (ImportError, SyntaxError)):
         raise _numpy_doc_string_cache
-    from numpydoc.docscrape import NumpyDocString  # type: ignore[import]
-    _numpy_doc_string_cache = NumpyDocString
+    if _numpy_doc_string_cache is None:
+        try:
+            from numpydoc.docscrape import NumpyDocString  # type: ignore[import]
+        except (ImportError, SyntaxError) as e:
+            _numpy_doc_string_cache = e
+            raise
+        _numpy_doc_string_cache = NumpyDocString
     return _numpy_doc_string_cache
 
 
+@lru_cache(maxsize=None)
+def _get_numpydoc_version():
+    try:
+        _get_numpy_doc_string_cls()
+    except (ImportError, SyntaxError):
+        return None
+    import numpydoc  # type: ignore[import]
+    return getattr(numpydoc, '__version__', '')
+
+
+def _get_type_strings_cache():
+    global _type_strings_cache
+    cache_directory = settings.cache_directory
+    if _type_strings_cache is None or _type_strings_cache[0] != cache_directory:
+        path = os.path.join(
+            cache_directory,
+            'docstrings-%s-%s.pkl' % (_TYPE_STRINGS_CACHE_VERSION, _get_numpydoc_version()),
+        )
+        pickle_log = PickleLog(path, _MAX_TYPE_STRINGS_CACHE_SIZE)
+        cache = pickle_log.load() if settings.save_docstring_cache else {}
+        _type_strings_cache = cache_directory, pickle_log, cache
+    return _type_strings_cache[1:]
+
+
+def _get_cached_type_strings(search_func, docstring, *args):
+    """
+    Searching docstrings for types is slow, especially with numpydoc. The
+    results only depend on the docstring, so they are cached and saved in
+    :data:`jedi.settings.cache_directory` (see
+    :data:`jedi.settings.save_docstring_cache`).
+    """
+    pickle_log, cache = _get_type_strings_cache()
+    digest = hashlib.sha256(docstring.encode('utf-8', 'replace')).hexdigest()
+    key = (search_func.__name__, digest) + args
+    try:
+        type_strings = cache.pop(key)
+    except KeyError:
+        type_strings = list(search_func(docstring, *args))
+        if settings.save_docstring_cache:
+            pickle_log.append(key, type_strings)
+    # The most recently used type strings are at the end.
+    cache[key] = type_strings
+    while len(cache) > _MAX_TYPE_STRINGS:
+        del cache[next(iter(cache))]
+    return type_strings
+
+
 def _search_param_in_numpydocstr(docstr, param_str):
     """Search `docstr` (in numpydoc format) for type(-s) of `param_str`."""
     with warnings.catch_warnings():
@@ -201,9 +263,8 @@ def _infer_for_statement_string(module_context, string):
 
     debug.dbg('Parse docstring code %s', string, color='BLUE')
     grammar = module_context.inference_state.grammar
-    try:
-        module = grammar.parse(code.format(indent_block(string)), error_recovery=False)
-    except ParserSyntaxError:
+    module = _parse_pseudo_module(grammar, code.format(indent_block(string)))
+    if module is None:
         return []
     try:
         funcdef = next(module.iter_funcdefs())
@@ -230,6 +291,19 @@ def _infer_for_statement_string(module_context, string):
     return list(_execute_types_in_stmt(func_execution_context, stmt))
 
 
+@lru_cache(maxsize=1000)
+def _parse_pseudo_module(grammar, code):
+    """
+    Returns None for invalid code. Most type strings are short and common
+    (e.g. ``:type foo: str``), so the same few pseudo functions are parsed
+    for many params.
+    """
+    try:
+        return grammar.parse(code, error_recovery=False)
+    except ParserSyntaxError:
+        return None
+
+
 def _execute_types_in_stmt(module_context, stmt):
     """
     Executing all types or general elements that we find in a statement. This
@@ -268,7 +342,8 @@ def infer_param(function_value, param):
     def infer_docstring(docstring):
         return ValueSet(
             p
-            for param_str in _search_param_in_docstr(docstring, param.name.value)
+            for param_str in _get_cached_type_strings(
+                _search_param_in_docstr, docstring, param.name.value)
             for p in _infer_for_statement_string(module_context, param_str)
         )
     module_context = function_value.get_root_context()
@@ -285,16 +360,18 @@ def infer_param(function_value, param):
     return types
 
 
+def _search_return_in_docstr(code):
+    for p in DOCSTRING_RETURN_PATTERNS:
+        match = p.search(code)
+        if match:
+            yield _strip_rst_role(match.group(1))
+    # Check for numpy style return hint
+    yield from _search_return_in_numpydocstr(code)
+
+
 @inference_state_method_cache()
 @iterator_to_value_set
 def infer_return_types(function_value):
-    def search_return_in_docstr(code):
-        for p in DOCSTRING_RETURN_PATTERNS:
-            match = p.search(code)
-            if match:
-                yield _strip_rst_role(match.group(1))
-        # Check for numpy style return hint
-        yield from _search_return_in_numpydocstr(code)
-
-    for type_str in search_return_in_docstr(function_value.py__doc__()):
+    type_strs = _get_cached_type_strings(_search_return_in_docstr, function_value.py__doc__())
+    for type_str in type_strs:
         yield from _infer_for_statement_string(function_value.get_root_context(), type_str)
@@ -27,7 +27,7 @@ from jedi.inference.helpers import is_stdlib_path
 from jedi.inference.utils import to_list
 from jedi.inference.value import instance
 from jedi.inference.base_value import ValueSet, NO_VALUES
-from jedi.inference.references import get_module_contexts_containing_name
+from jedi.inference.references import get_module_contexts_calling_name
 from jedi.inference import recursion
 
 
@@ -112,12 +112,14 @@ def _search_function_arguments(module_context, funcdef, string_name):
             string_name = cls.name.value
             compare_node = cls
 
-    found_arguments = False
     i = 0
     inference_state = module_context.inference_state
 
-    if settings.dynamic_params_for_other_modules:
-        module_contexts = get_module_contexts_containing_name(
+    if settings.dynamic_params_for_other_modules \
+            and inference_state.dynamic_params_for_other_modules:
+        # Only modules that actually contain calls of the name are returned,
+        # so we can look at all of them.
+        module_contexts = get_module_contexts_calling_name(
             inference_state, [module_context], string_name,
             # Limit the amounts of files to be opened massively.
             limit_reduction=5,
@@ -136,15 +138,8 @@ def _search_function_arguments(module_context, funcdef, string_name):
                 return
 
             random_context = for_mod_context.create_context(name)
-            for arguments in _check_name_for_execution(
-                    inference_state, random_context, compare_node, name, trailer):
-                found_arguments = True
-                yield arguments
-
-        # If there are results after processing a module, we're probably
-        # good to process. This is a speed optimization.
-        if found_arguments:
-            return
+            yield from _check_name_for_execution(
+                inference_state, random_context, compare_node, name, trailer)
 
 
 def _get_lambda_name(node):
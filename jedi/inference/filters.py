@@ -3,7 +3,8 @@ Filters are objects that you can use to filter names in different scopes. They
 are needed for name resolution.
 """
 from abc import abstractmethod
-from typing import List, MutableMapping, Type
+from bisect import bisect_left
+from typing import Dict, List, MutableMapping, Tuple, Type
 import weakref
 
 from parso.tree import search_ancestor
@@ -19,6 +20,10 @@ from jedi.inference.names import TreeNameDefinition, ParamName, \
 
 _definition_name_cache: MutableMapping[UsedNamesMapping, List[Name]]
 _definition_name_cache = weakref.WeakKeyDictionary()
+_ScopeDefinitions = Dict[object, Tuple[List[Tuple[int, int]], Tuple[Name, ...]]]
+_scope_definition_name_cache: MutableMapping[UsedNamesMapping, Dict[str, _ScopeDefinitions]]
+_scope_definition_name_cache = weakref.WeakKeyDictionary()
+_NO_SCOPE_DEFINITIONS: Tuple[List[Tuple[int, int]], Tuple[Name, ...]] = ([], ())
 
 
 class AbstractFilter:
@@ -70,6 +75,38 @@ def _get_definition_names(used_names, name_key):
         return result
 
 
+def _get_scope_definition_names(used_names, name_key):
+    """
+    Returns a dict of scope -> (start positions, definitions) for all the
+    definitions of a name that are directly defined in that scope (the ones a
+    ``ParserTreeFilter`` on that scope would consider reachable). The
+    definitions are sorted by position, so the ones before a position can be
+    found with a binary search.
+    """
+    try:
+        for_module = _scope_definition_name_cache[used_names]
+    except KeyError:
+        for_module = _scope_definition_name_cache[used_names] = {}
+
+    try:
+        return for_module[name_key]
+    except KeyError:
+        by_scope: Dict[object, List[Name]] = {}
+        for name in _get_definition_names(used_names, name_key):
+            parent = name.parent
+            if parent.type == 'trailer':
+                continue
+            base_node = parent if parent.type in ('classdef', 'funcdef') else name
+            scope = get_cached_parent_scope(used_names, base_node)
+            by_scope.setdefault(scope, []).append(name)
+
+        result = for_module[name_key] = {}
+        for scope, names in by_scope.items():
+            names.sort(key=lambda name: name.start_pos)
+            result[scope] = [n.start_pos for n in names], tuple(names)
+        return result
+
+
 class AbstractUsedNamesFilter(AbstractFilter):
     name_class = TreeNameDefinition
 
@@ -81,9 +118,12 @@ class AbstractUsedNamesFilter(AbstractFilter):
 
     def get(self, name):
         return self._convert_names(self._filter(
-            _get_definition_names(self._used_names, name),
+            self._get_definitions(name),
         ))
 
+    def _get_definitions(self, name):
+        return _get_definition_names(self._used_names, name)
+
     def _convert_names(self, names):
         return [self.name_class(self.parent_context, name) for name in names]
 
@@ -116,6 +156,16 @@ class ParserTreeFilter(AbstractUsedNamesFilter):
         self._origin_scope = origin_scope
         self._until_position = until_position
 
+    def _get_definitions(self, name):
+        # Only use the definitions in the scope of this filter (instead of
+        # all the definitions of the name in the module).
+        positions, names = _get_scope_definition_names(self._used_names, name).get(
+            self._parser_scope, _NO_SCOPE_DEFINITIONS
+        )
+        if self._until_position is not None:
+            return names[:bisect_left(positions, self._until_position)]
+        return names
+
     def _filter(self, names):
         names = super()._filter(names)
         names = [n for n in names if self._is_name_reachable(n)]
@@ -68,6 +68,20 @@ def infer_import(context, tree_name):
     return values
 
 
+def prefetch_imports(module_context, stop_event):
+    """
+    Follows all the imports of a module. This loads (and therefore parses) the
+    imported modules and their stubs. Stops before the next import once
+    ``stop_event`` is set.
+    """
+    for import_node in module_context.tree_node.iter_imports():
+        for name in import_node.get_defined_names():
+            if stop_event.is_set():
+                debug.dbg('Stopped prefetching imports')
+                return
+            infer_import(module_context, name)
+
+
 @inference_state_method_cache(default=[])
 def goto_import(context, tree_name):
     module_context = context.get_root_context()
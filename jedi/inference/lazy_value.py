@@ -3,6 +3,8 @@ from jedi.common import monkeypatch
 
 
 class AbstractLazyValue:
+    __slots__ = ('data', 'min', 'max')
+
     def __init__(self, data, min=1, max=1):
         self.data = data
         self.min = min
@@ -17,17 +19,23 @@ class AbstractLazyValue:
 
 class LazyKnownValue(AbstractLazyValue):
     """data is a Value."""
+    __slots__ = ()
+
     def infer(self):
         return ValueSet([self.data])
 
 
 class LazyKnownValues(AbstractLazyValue):
     """data is a ValueSet."""
+    __slots__ = ()
+
     def infer(self):
         return self.data
 
 
 class LazyUnknownValue(AbstractLazyValue):
+    __slots__ = ()
+
     def __init__(self, min=1, max=1):
         super().__init__(None, min, max)
 
@@ -36,6 +44,8 @@ class LazyUnknownValue(AbstractLazyValue):
 
 
 class LazyTreeValue(AbstractLazyValue):
+    __slots__ = ('context', '_predefined_names')
+
     def __init__(self, context, node, min=1, max=1):
         super().__init__(node, min, max)
         self.context = context
@@ -57,5 +67,7 @@ def get_merged_lazy_value(lazy_values):
 
 class MergedLazyValues(AbstractLazyValue):
     """data is a list of lazy values."""
+    __slots__ = ()
+
     def infer(self):
         return ValueSet.from_sets(l.infer() for l in self.data)
@@ -24,8 +24,10 @@ therefore the quality might not always be maximal.
 .. autodata:: total_function_execution_limit
 .. autodata:: per_function_execution_limit
 .. autodata:: per_function_recursion_limit
+.. autodata:: inference_time_limit
 """
 
+import time
 from contextlib import contextmanager
 
 from jedi import debug
@@ -48,6 +50,15 @@ per_function_recursion_limit = 2
 """
 A function may not be executed more than this number of times recursively.
 """
+inference_time_limit = None
+"""
+An optional time budget (in seconds) for the function executions of an API
+request like :meth:`.Script.complete`, e.g. ``0.05``. If it is set, the
+execution counters (``total_function_execution_limit`` and
+``per_function_execution_limit``) are not used. Instead functions are executed
+as long as there's time left, which makes inference go deeper in small files
+and stop early in pathological ones. The recursion limits still apply.
+"""
 
 
 class RecursionDetector:
@@ -103,6 +114,30 @@ class ExecutionRecursionDetector:
         self._parent_execution_funcs = []
         self._funcdef_execution_counts = {}
         self._execution_count = 0
+        self._deadline = None
+        self._in_request = False
+        # Is set as soon as an execution is refused, which means that the
+        # results of the inference might be incomplete.
+        self.limit_reached = False
+
+    @contextmanager
+    def new_request(self):
+        """
+        Every API request (e.g. a completion) gets its own time budget and
+        reports on its own if a limit was reached. Requests that are made
+        while another one is running are part of the outer request.
+        """
+        if self._in_request:
+            yield
+            return
+
+        self._in_request = True
+        self._deadline = None
+        self.limit_reached = False
+        try:
+            yield
+        finally:
+            self._in_request = False
 
     def pop_execution(self):
         self._parent_execution_funcs.pop()
@@ -123,25 +158,37 @@ class ExecutionRecursionDetector:
             # they usually just help a lot with getting good results.
             return False
 
-        if self._recursion_level > recursion_limit:
-            debug.warning('Recursion limit (%s) reached', recursion_limit)
+        if self._is_limit_reached(funcdef, module_context):
+            self.limit_reached = True
             return True
+        return False
 
-        if self._execution_count >= total_function_execution_limit:
-            debug.warning('Function execution limit (%s) reached', total_function_execution_limit)
+    def _is_limit_reached(self, funcdef, module_context):
+        if self._recursion_level > recursion_limit:
+            debug.warning('Recursion limit (%s) reached', recursion_limit)
             return True
-        self._execution_count += 1
 
-        if self._funcdef_execution_counts.setdefault(funcdef, 0) >= per_function_execution_limit:
-            if module_context.py__name__() == 'typing':
-                return False
-            debug.warning(
-                'Per function execution limit (%s) reached: %s',
-                per_function_execution_limit,
-                funcdef
-            )
-            return True
-        self._funcdef_execution_counts[funcdef] += 1
+        if inference_time_limit is not None:
+            if self._is_time_limit_reached():
+                return True
+        else:
+            if self._execution_count >= total_function_execution_limit:
+                debug.warning('Function execution limit (%s) reached',
+                              total_function_execution_limit)
+                return True
+            self._execution_count += 1
+
+            if self._funcdef_execution_counts.setdefault(funcdef, 0) \
+                    >= per_function_execution_limit:
+                if module_context.py__name__() == 'typing':
+                    return False
+                debug.warning(
+                    'Per function execution limit (%s) reached: %s',
+                    per_function_execution_limit,
+                    funcdef
+                )
+                return True
+            self._funcdef_execution_counts[funcdef] += 1
 
         if self._parent_execution_funcs.count(funcdef) > per_function_recursion_limit:
             debug.warning(
@@ -151,3 +198,13 @@ class ExecutionRecursionDetector:
             )
             return True
         return False
+
+    def _is_time_limit_reached(self):
+        now = time.perf_counter()
+        if self._deadline is None:
+            # The budget starts with the first execution.
+            self._deadline = now + inference_time_limit
+        elif now > self._deadline:
+            debug.warning('Inference time limit (%ss) reached', inference_time_limit)
+            return True
+        return False
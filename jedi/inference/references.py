@@ -1,10 +1,11 @@
+import mmap
 import os
 import re
 
 from parso import python_bytes_to_unicode
 
 from jedi.debug import dbg
-from jedi.file_io import KnownContentFileIO, FolderIO
+from jedi.file_io import KnownContentFileIO, FileIO, FolderIO
 from jedi.inference.names import SubModuleName
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
@@ -25,6 +26,12 @@ For now we keep the amount of parsed files really low, since parsing might take
 easily 100ms for bigger files.
 """
 
+_CALL_REGEX = re.compile(r'([^\W\d]\w*)\s*\(')
+# Dict[path, Tuple[modification time, FrozenSet[str]]], the most recently used
+# paths are at the end. Searches never open more files than this.
+_called_names_cache = {}
+_CALLED_NAMES_CACHE_SIZE = _OPENED_FILE_LIMIT
+
 
 def _resolve_names(definition_names, avoid_names=()):
     for name in definition_names:
@@ -165,11 +172,87 @@ def find_references(module_context, tree_name, only_in_module=False):
     return result
 
 
-def _check_fs(inference_state, file_io, regex):
+def _get_called_names(file_io):
+    """
+    Returns the names that are potentially called in a file (names followed by
+    an opening bracket). This is a cheap scan without parsing, which is cached
+    for the most recently used files and redone if the file changes.
+    """
+    path = file_io.path
+    modified = file_io.get_last_modified()
+    try:
+        cached_modified, names = _called_names_cache.pop(path)
+    except KeyError:
+        pass
+    else:
+        if modified is not None and cached_modified == modified:
+            _called_names_cache[path] = cached_modified, names
+            return names
+
     try:
         code = file_io.read()
     except FileNotFoundError:
-        return None
+        return frozenset()
+    code = python_bytes_to_unicode(code, errors='replace')
+    names = frozenset(_CALL_REGEX.findall(code))
+    if modified is not None:
+        _called_names_cache[path] = modified, names
+        if len(_called_names_cache) > _CALLED_NAMES_CACHE_SIZE:
+            del _called_names_cache[next(iter(_called_names_cache))]
+    return names
+
+
+def get_module_contexts_calling_name(inference_state, module_contexts, name,
+                                     limit_reduction=1):
+    """
+    Like ``get_module_contexts_containing_name``, but only returns the
+    modules that potentially call ``name``. Since the called names of a file
+    are cached, this is a lot cheaper than searching the name in the files.
+
+    :param limit_reduction: Divides the limits of opened and parsed files by
+        this factor.
+    """
+    for module_context in module_contexts:
+        if module_context.is_compiled():
+            continue
+        yield module_context
+
+    if len(name) <= 2:
+        return
+
+    parse_limit = _PARSED_FILE_LIMIT / limit_reduction
+    open_limit = _OPENED_FILE_LIMIT / limit_reduction
+    file_io_count = 0
+    parsed_file_count = 0
+    for file_io in _find_project_modules(inference_state, module_contexts):
+        file_io_count += 1
+        if file_io_count > open_limit:
+            dbg('Hit limit of opened files: %s', open_limit)
+            break
+        if name not in _get_called_names(file_io):
+            continue
+        m = load_module_from_path(inference_state, file_io)
+        if m.is_compiled():
+            continue
+        parsed_file_count += 1
+        yield m.as_context()
+        if parsed_file_count >= parse_limit:
+            dbg('Hit limit of parsed files: %s', parse_limit)
+            break
+
+
+def _check_fs(inference_state, file_io, regex, bytes_regex=None, search_index=None):
+    if bytes_regex is not None and isinstance(file_io, FileIO):
+        code = _read_if_matching(file_io, bytes_regex, search_index)
+        if code is None:
+            return None
+    else:
+        try:
+            code = file_io.read()
+        except FileNotFoundError:
+            return None
+        if search_index is not None:
+            search_index.add(file_io.path, file_io.get_last_modified(), code)
     code = python_bytes_to_unicode(code, errors='replace')
     if not regex.search(code):
         return None
@@ -180,6 +263,29 @@ def _check_fs(inference_state, file_io, regex):
     return m.as_context()
 
 
+def _read_if_matching(file_io, bytes_regex, search_index=None):
+    """
+    Returns the content of a file only if ``bytes_regex`` matches it. The file
+    is memory mapped, so files that don't match are neither copied nor
+    decoded.
+    """
+    try:
+        with open(file_io.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size == 0:
+                if search_index is not None:
+                    search_index.add(file_io.path, stat.st_mtime, b'')
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if search_index is not None:
+                    search_index.add(file_io.path, stat.st_mtime, mapped)
+                if bytes_regex.search(mapped) is None:
+                    return None
+                return mapped[:]
+    except (FileNotFoundError, IsADirectoryError, PermissionError):
+        return None
+
+
 def gitignored_lines(folder_io, file_io):
     ignored_paths = set()
     ignored_names = set()
@@ -282,15 +388,30 @@ def get_module_contexts_containing_name(inference_state, module_contexts, name,
                                   limit_reduction=limit_reduction)
 
 
-def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=1):
+def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=1,
+                       search_index=None):
+    """
+    :param search_index: A :class:`jedi.api.search_index.SearchIndex`. Files
+        that don't contain the name according to it are skipped without
+        counting them as opened. The files that are read are added to it.
+    """
     parse_limit = _PARSED_FILE_LIMIT / limit_reduction
     open_limit = _OPENED_FILE_LIMIT / limit_reduction
     file_io_count = 0
     parsed_file_count = 0
     regex = re.compile(r'\b' + re.escape(name) + r'\b')
+    bytes_regex = None
+    if name.isascii():
+        # ASCII names look the same in all the encodings that are used for
+        # Python code, so files can be checked before decoding them. This
+        # matches a superset of the unicode regex (\b only knows ASCII for
+        # bytes), so the result is checked again after decoding.
+        bytes_regex = re.compile(rb'\b' + re.escape(name.encode('ascii')) + rb'\b')
     for file_io in file_io_iterator:
+        if search_index is not None and not search_index.might_contain(file_io, name):
+            continue
         file_io_count += 1
-        m = _check_fs(inference_state, file_io, regex)
+        m = _check_fs(inference_state, file_io, regex, bytes_regex, search_index)
         if m is not None:
             parsed_file_count += 1
             yield m
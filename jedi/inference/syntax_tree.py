@@ -841,6 +841,8 @@ def check_tuple_assignments(name, value_set):
 
 
 class ContextualizedSubscriptListNode(ContextualizedNode):
+    __slots__ = ()
+
     def infer(self):
         return _infer_subscript_list(self.context, self.node)
 
@@ -4,24 +4,30 @@ A module to deal with stuff like `list.append` and `set.add`.
 Array modifications
 *******************
 
-If the content of an array (``set``/``list``) is requested somewhere, the
-current module will be checked for appearances of ``arr.append``,
-``arr.insert``, etc.  If the ``arr`` name points to an actual array, the
-content will be added
+If the content of an array (``set``/``list``/``dict``) is requested somewhere,
+the current module will be checked for appearances of ``arr.append``,
+``arr.insert``, ``dct.update``, etc.  If the ``arr`` name points to an actual
+array, the content will be added
 
 This can be really cpu intensive, as you can imagine. Because |jedi| has to
 follow **every** ``append`` and check whether it's the right array. However this
 works pretty good, because in *slow* cases, the recursion detector and other
-settings will stop this process.
+settings will stop this process. The places where arrays are modified are
+collected once per module (see ``_get_mutation_sites``), so at least the
+search for them is cheap.
 
 It is important to note that:
 
 1. Array modfications work only in the current module.
 2. Jedi only checks Array additions; ``list.pop``, etc are ignored.
 """
+import weakref
+from bisect import bisect_left, bisect_right
+
 from jedi import debug
 from jedi import settings
 from jedi.inference import recursion
+from jedi.inference import compiled
 from jedi.inference.base_value import ValueSet, NO_VALUES, HelperValueMixin, \
     ValueWrapper
 from jedi.inference.lazy_value import LazyKnownValues
@@ -30,11 +36,58 @@ from jedi.inference.cache import inference_state_method_cache
 
 _sentinel = object()
 
+_SEARCH_NAMES = {
+    'list': ('append', 'extend', 'insert'),
+    'set': ('add', 'update'),
+    'dict': ('setdefault', 'update'),
+}
+_MUTATION_NAMES = frozenset(n for names in _SEARCH_NAMES.values() for n in names)
+_mutation_site_cache = weakref.WeakKeyDictionary()
+_NO_MUTATION_SITES = ([], ())
+
+
+def _get_mutation_sites(module_node):
+    """
+    Returns a dict of method name -> (start positions, (name, trailer) tuples)
+    for all calls like ``foo.append(x)`` in a module. The sites are sorted by
+    position, so the ones within a certain node can be found with a binary
+    search. The result is cached as long as the module's tree is alive.
+    """
+    used_names = module_node.get_used_names()
+    try:
+        return _mutation_site_cache[used_names]
+    except KeyError:
+        pass
+
+    sites = {}
+    for add_name in _MUTATION_NAMES:
+        found = []
+        for name in used_names.get(add_name, ()):
+            trailer = name.parent
+            if trailer.type != 'trailer' or trailer.children[0] != '.':
+                continue
+            power = trailer.parent
+            trailer_pos = power.children.index(trailer)
+            try:
+                execution_trailer = power.children[trailer_pos + 1]
+            except IndexError:
+                continue
+            if execution_trailer.type != 'trailer' \
+                    or execution_trailer.children[0] != '(' \
+                    or execution_trailer.children[1] == ')':
+                continue
+            found.append((name, execution_trailer))
+        if found:
+            found.sort(key=lambda site: site[0].start_pos)
+            sites[add_name] = [name.start_pos for name, _ in found], tuple(found)
+
+    _mutation_site_cache[used_names] = sites
+    return sites
+
 
 def check_array_additions(context, sequence):
     """ Just a mapper function for the internal _internal_check_array_additions """
-    if sequence.array_type not in ('list', 'set'):
-        # TODO also check for dict updates
+    if sequence.array_type not in _SEARCH_NAMES:
         return NO_VALUES
 
     return _internal_check_array_additions(context, sequence)
@@ -44,7 +97,7 @@ def check_array_additions(context, sequence):
 @debug.increase_indent
 def _internal_check_array_additions(context, sequence):
     """
-    Checks if a `Array` has "add" (append, insert, extend) statements:
+    Checks if a `Array` has "add" (append, insert, extend, update) statements:
 
     >>> a = [""]
     >>> a.append(1)
@@ -60,6 +113,24 @@ def _internal_check_array_additions(context, sequence):
     def find_additions(context, arglist, add_name):
         params = list(arguments.TreeArguments(context.inference_state, context, arglist).unpack())
         result = set()
+        if is_dict:
+            # Only the keys are interesting, because that's what iterating
+            # over a dict returns.
+            if add_name == 'setdefault':
+                params = params[:1]
+            for key, lazy_value in params:
+                if key is not None:
+                    result.add(LazyKnownValues(ValueSet([
+                        compiled.create_simple_object(context.inference_state, key)
+                    ])))
+                elif add_name == 'setdefault':
+                    result.add(lazy_value)
+                else:
+                    for value in lazy_value.infer():
+                        if value.array_type == 'dict':
+                            result |= set(value.py__iter__())
+            return result
+
         if add_name in ['insert']:
             params = params[1:]
         if add_name in ['append', 'add', 'insert']:
@@ -70,55 +141,41 @@ def _internal_check_array_additions(context, sequence):
                 result |= set(lazy_value.infer().iterate())
         return result
 
-    temp_param_add, settings.dynamic_params_for_other_modules = \
-        settings.dynamic_params_for_other_modules, False
+    inference_state = context.inference_state
+    temp_param_add, inference_state.dynamic_params_for_other_modules = \
+        inference_state.dynamic_params_for_other_modules, False
 
-    is_list = sequence.name.string_name == 'list'
-    search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
+    is_dict = sequence.array_type == 'dict'
+    search_names = _SEARCH_NAMES[sequence.array_type]
+    mutation_sites = _get_mutation_sites(module_context.tree_node)
+    value_node = context.tree_node
 
     added_types = set()
     for add_name in search_names:
-        try:
-            possible_names = module_context.tree_node.get_used_names()[add_name]
-        except KeyError:
-            continue
-        else:
-            for name in possible_names:
-                value_node = context.tree_node
-                if not (value_node.start_pos < name.start_pos < value_node.end_pos):
-                    continue
-                trailer = name.parent
-                power = trailer.parent
-                trailer_pos = power.children.index(trailer)
-                try:
-                    execution_trailer = power.children[trailer_pos + 1]
-                except IndexError:
-                    continue
-                else:
-                    if execution_trailer.type != 'trailer' \
-                            or execution_trailer.children[0] != '(' \
-                            or execution_trailer.children[1] == ')':
-                        continue
-
-                random_context = context.create_context(name)
-
-                with recursion.execution_allowed(context.inference_state, power) as allowed:
-                    if allowed:
-                        found = infer_call_of_leaf(
+        positions, sites = mutation_sites.get(add_name, _NO_MUTATION_SITES)
+        # Only the sites within the context are interesting.
+        start = bisect_right(positions, value_node.start_pos)
+        end = bisect_left(positions, value_node.end_pos)
+        for name, execution_trailer in sites[start:end]:
+            random_context = context.create_context(name)
+            power = execution_trailer.parent
+
+            with recursion.execution_allowed(context.inference_state, power) as allowed:
+                if allowed:
+                    found = infer_call_of_leaf(
+                        random_context,
+                        name,
+                        cut_own_trailer=True
+                    )
+                    if sequence in found:
+                        # The arrays match. Now add the results
+                        added_types |= find_additions(
                             random_context,
-                            name,
-                            cut_own_trailer=True
+                            execution_trailer.children[1],
+                            add_name
                         )
-                        if sequence in found:
-                            # The arrays match. Now add the results
-                            added_types |= find_additions(
-                                random_context,
-                                execution_trailer.children[1],
-                                add_name
-                            )
-
-    # reset settings
-    settings.dynamic_params_for_other_modules = temp_param_add
+
+    inference_state.dynamic_params_for_other_modules = temp_param_add
     debug.dbg('Dynamic array result %s', added_types, color='MAGENTA')
     return added_types
 
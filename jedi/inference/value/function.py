@@ -40,6 +40,8 @@ class LambdaName(AbstractNameDefinition):
 
 
 class FunctionAndClassBase(TreeValue):
+    __slots__ = ()
+
     def get_qualified_names(self):
         if self.parent_context.is_class():
             n = self.parent_context.get_qualified_names()
@@ -54,6 +56,8 @@ class FunctionAndClassBase(TreeValue):
 
 
 class FunctionMixin:
+    __slots__ = ()
+
     api_type = 'function'
 
     def get_filters(self, origin_scope=None):
@@ -125,6 +129,8 @@ class FunctionMixin:
 
 
 class FunctionValue(FunctionMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
+    __slots__ = ()
+
     @classmethod
     def from_context(cls, context, tree_node):
         def create(tree_node):
@@ -179,6 +185,8 @@ class FunctionNameInClass(NameWrapper):
 
 
 class MethodValue(FunctionValue):
+    __slots__ = ('class_context',)
+
     def __init__(self, inference_state, class_context, *args, **kwargs):
         super().__init__(inference_state, *args, **kwargs)
         self.class_context = class_context
@@ -200,6 +208,8 @@ class MethodValue(FunctionValue):
 
 
 class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
+    __slots__ = ()
+
     def infer_annotations(self):
         raise NotImplementedError
 
@@ -351,6 +361,8 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
 
 
 class FunctionExecutionContext(BaseFunctionExecutionContext):
+    __slots__ = ('_arguments',)
+
     def __init__(self, function_value, arguments):
         super().__init__(function_value)
         self._arguments = arguments
@@ -375,6 +387,8 @@ class FunctionExecutionContext(BaseFunctionExecutionContext):
 
 
 class AnonymousFunctionExecution(BaseFunctionExecutionContext):
+    __slots__ = ()
+
     def infer_annotations(self):
         # I don't think inferring anonymous executions is a big thing.
         # Anonymous contexts are mostly there for the user to work in. ~ dave
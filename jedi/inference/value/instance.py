@@ -7,7 +7,8 @@ from jedi import settings
 from jedi.inference import compiled
 from jedi.inference.compiled.value import CompiledValueFilter
 from jedi.inference.helpers import values_from_qualified_names, is_big_annoying_library
-from jedi.inference.filters import AbstractFilter, AnonymousFunctionExecutionFilter
+from jedi.inference.filters import AbstractFilter, AnonymousFunctionExecutionFilter, \
+    _get_definition_names
 from jedi.inference.names import ValueName, TreeNameDefinition, ParamName, \
     NameWrapper
 from jedi.inference.base_value import Value, NO_VALUES, ValueSet, \
@@ -24,6 +25,8 @@ from jedi.parser_utils import function_is_staticmethod, function_is_classmethod
 
 
 class InstanceExecutedParamName(ParamName):
+    __slots__ = ('_instance',)
+
     def __init__(self, instance, function_value, tree_name):
         super().__init__(
             function_value, tree_name, arguments=None)
@@ -59,6 +62,8 @@ class AnonymousMethodExecutionFilter(AnonymousFunctionExecutionFilter):
 
 
 class AnonymousMethodExecutionContext(BaseFunctionExecutionContext):
+    __slots__ = ('instance',)
+
     def __init__(self, instance, value):
         super().__init__(value)
         self.instance = instance
@@ -82,12 +87,16 @@ class AnonymousMethodExecutionContext(BaseFunctionExecutionContext):
 
 
 class MethodExecutionContext(FunctionExecutionContext):
+    __slots__ = ('instance',)
+
     def __init__(self, instance, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.instance = instance
 
 
 class AbstractInstanceValue(Value):
+    __slots__ = ('class_value',)
+
     api_type = 'instance'
 
     def __init__(self, inference_state, parent_context, class_value):
@@ -165,6 +174,8 @@ class AbstractInstanceValue(Value):
 
 
 class CompiledInstance(AbstractInstanceValue):
+    __slots__ = ('_arguments',)
+
     # This is not really a compiled class, it's just an instance from a
     # compiled class.
     def __init__(self, inference_state, parent_context, class_value, arguments):
@@ -189,6 +200,8 @@ class CompiledInstance(AbstractInstanceValue):
 
 
 class _BaseTreeInstance(AbstractInstanceValue):
+    __slots__ = ()
+
     @property
     def array_type(self):
         name = self.class_value.py__name__()
@@ -303,6 +316,8 @@ class _BaseTreeInstance(AbstractInstanceValue):
 
 
 class TreeInstance(_BaseTreeInstance):
+    __slots__ = ('_arguments', 'tree_node')
+
     def __init__(self, inference_state, parent_context, class_value, arguments):
         # I don't think that dynamic append lookups should happen here. That
         # sounds more like something that should go to py__iter__.
@@ -394,6 +409,8 @@ class TreeInstance(_BaseTreeInstance):
 
 
 class AnonymousInstance(_BaseTreeInstance):
+    __slots__ = ()
+
     _arguments = None
 
 
@@ -485,6 +502,8 @@ class SelfName(TreeNameDefinition):
     """
     This name calculates the parent_context lazily.
     """
+    __slots__ = ('_instance', 'class_context')
+
     def __init__(self, instance, class_context, tree_name):
         self._instance = instance
         self.class_context = class_context
@@ -566,6 +585,11 @@ class SelfAttributeFilter(ClassFilter):
         )
         self._instance = instance
 
+    def _get_definitions(self, name):
+        # The self names are not defined in the class scope, so we need to
+        # look at all the definitions in the module.
+        return _get_definition_names(self._used_names, name)
+
     def _filter(self, names):
         start, end = self._parser_scope.start_pos, self._parser_scope.end_pos
         names = [n for n in names if start < n.start_pos < end]
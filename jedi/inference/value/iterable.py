@@ -454,6 +454,7 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         # yield all the types.
         for _ in types:
             yield LazyKnownValues(types)
+        yield from check_array_additions(self._defining_context, self)
 
     @publish_method('values')
     def _imitate_values(self, arguments):
@@ -482,6 +483,9 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         return ValueSet.from_sets(
             self._defining_context.infer_node(k)
             for k, v in self.get_tree_entries()
+        ) | ValueSet.from_sets(
+            lazy_value.infer()
+            for lazy_value in check_array_additions(self._defining_context, self)
         )
 
 
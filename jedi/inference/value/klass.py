@@ -55,6 +55,8 @@ from jedi.plugins import plugin_manager
 
 
 class ClassName(TreeNameDefinition):
+    __slots__ = ('_apply_decorators', '_class_value')
+
     def __init__(self, class_value, tree_name, name_context, apply_decorators):
         super().__init__(name_context, tree_name)
         self._apply_decorators = apply_decorators
@@ -143,6 +145,8 @@ class ClassFilter(ParserTreeFilter):
 
 
 class ClassMixin:
+    __slots__ = ()
+
     def is_class(self):
         return True
 
@@ -333,6 +337,8 @@ class ClassMixin:
 
 
 class ClassValue(ClassMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
+    __slots__ = ()
+
     api_type = 'class'
 
     @inference_state_method_cache()
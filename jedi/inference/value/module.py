@@ -35,6 +35,8 @@ class _ModuleAttributeName(AbstractNameDefinition):
 
 
 class SubModuleDictMixin:
+    __slots__ = ()
+
     @inference_state_method_cache()
     def sub_modules_dict(self):
         """
@@ -56,6 +58,8 @@ class SubModuleDictMixin:
 
 
 class ModuleMixin(SubModuleDictMixin):
+    __slots__ = ()
+
     _module_name_class = ModuleName
 
     def get_filters(self, origin_scope=None):
@@ -135,6 +139,8 @@ class ModuleMixin(SubModuleDictMixin):
 
 
 class ModuleValue(ModuleMixin, TreeValue):
+    __slots__ = ('file_io', '_path', 'string_names', 'code_lines', '_is_package')
+
     api_type = 'module'
 
     def __init__(self, inference_state, module_node, code_lines, file_io=None,
@@ -18,6 +18,172 @@ _FLOW_KEYWORDS = (
 )
 
 
+_TOP_LEVEL_START_REGEX = re.compile(r'(?!(?:else|elif|except|finally)\b)[^\W\d]')
+_HEADER_REGEX = re.compile(
+    r'((?:async\s+)?def\s+\w+\s*\(.*\)(?:\s*->[^:]*)?|class\s+\w+\s*(?:\(.*\))?)\s*:'
+)
+_DEFINITION_REGEX = re.compile(r'(?:async\s+)?(def|class)\s+\w+')
+_ASSIGNMENT_REGEX = re.compile(r'([^\W\d]\w*)\s*(?::[^=]*)?=(?!=)\s*([\w.]+\s*\()?')
+_STRING_START_REGEX = re.compile(r'#|"""|\'\'\'|"|\'')
+# Match the rest of a string (or comment) after its start. They always match,
+# unterminated strings just end at the end of the line or of the code.
+_STRING_END_REGEXES = {
+    '#': re.compile(r'[^\n]*'),
+    '"""': re.compile(r'[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*(?:"""|\Z)', re.DOTALL),
+    "'''": re.compile(r"[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*(?:'''|\Z)", re.DOTALL),
+    '"': re.compile(r'[^"\\\n]*(?:\\.[^"\\\n]*)*(?:"|\n|\Z)', re.DOTALL),
+    "'": re.compile(r"[^'\\\n]*(?:\\.[^'\\\n]*)*(?:'|\n|\Z)", re.DOTALL),
+}
+
+
+def _get_string_lines(code):
+    """
+    Returns the indexes of the lines that start within a string, e.g. the
+    lines of a docstring after its first line.
+    """
+    string_lines = set()
+    line = 0
+    line_pos = 0
+    pos = 0
+    while True:
+        match = _STRING_START_REGEX.search(code, pos)
+        if match is None:
+            return string_lines
+        end = _STRING_END_REGEXES[match.group()].match(code, match.end()).end()
+        # A newline that ends an unterminated string is not part of it.
+        newline_count = code.count('\n', match.end(), end - 1)
+        if newline_count:
+            line += code.count('\n', line_pos, match.end())
+            line_pos = match.end()
+            string_lines.update(range(line + 1, line + newline_count + 1))
+        pos = end
+
+
+def crop_code(code, size, window_line=None):
+    """
+    Makes sure that huge files (typically generated code) don't get parsed
+    completely. The code up to ``size`` is kept as it is (cut at a top-level
+    statement). Of the rest only a skeleton of the top-level definitions is
+    kept: Function bodies are left away and so are assignments that span
+    multiple lines (apart from the callee if it's a call). Class bodies keep
+    the skeletons of their methods (including annotations) and their
+    single-line statements. All the other lines are empty, so positions stay
+    the same.
+
+    :param window_line: The top-level statement on this line is kept as it is
+        as well.
+    """
+    lines = code.split('\n')
+    string_lines = _get_string_lines(code)
+
+    def is_statement_start(index):
+        return index not in string_lines and _TOP_LEVEL_START_REGEX.match(lines[index])
+
+    kept_count = code.count('\n', 0, size)
+    while kept_count > 0 and not is_statement_start(kept_count):
+        kept_count -= 1
+
+    window_start = window_end = 0
+    if window_line is not None:
+        window_start = window_line - 1
+        while window_start > kept_count and not is_statement_start(window_start):
+            window_start -= 1
+        window_end = window_line
+        while window_end < len(lines) and not is_statement_start(window_end):
+            window_end += 1
+
+    new_lines = lines[:kept_count]
+    # The index of the header of the current class, the indentation of its
+    # body (once it's known) and if members were kept.
+    class_index = None
+    class_indentation = None
+    has_members = False
+    # If the header of the class continues on the next lines.
+    in_class_header = False
+    for index in range(kept_count, len(lines)):
+        line = lines[index]
+        in_window = window_start <= index < window_end
+        if not in_window and not is_statement_start(index):
+            new_line = ''
+            if in_class_header:
+                in_class_header = not line.split('#')[0].rstrip().endswith(':')
+            elif class_index is not None and index not in string_lines:
+                stripped = line.lstrip(' \t')
+                indentation = line[:len(line) - len(stripped)]
+                if class_indentation is None and stripped and not stripped.startswith('#'):
+                    class_indentation = indentation
+                if indentation and indentation == class_indentation:
+                    new_line = _crop_statement(stripped)
+                    if new_line.endswith(':'):
+                        # Nested classes are left empty.
+                        new_line += ' pass'
+                    if new_line:
+                        new_line = indentation + new_line
+                        has_members = True
+            new_lines.append(new_line)
+            continue
+
+        # A top-level statement ends the current class.
+        _close_class(new_lines, class_index, has_members)
+        class_index = class_indentation = None
+        has_members = in_class_header = False
+        if in_window:
+            new_lines.append(line)
+        else:
+            new_line = _crop_statement(line)
+            if new_line.endswith(':'):
+                class_index = len(new_lines)
+                in_class_header = _HEADER_REGEX.match(line) is None
+            new_lines.append(new_line)
+    _close_class(new_lines, class_index, has_members)
+    return '\n'.join(new_lines)
+
+
+def _close_class(new_lines, class_index, has_members):
+    if class_index is not None and not has_members:
+        new_lines[class_index] += ' pass'
+
+
+def _crop_statement(line):
+    """
+    Returns the skeleton of a statement that starts on ``line``. The headers
+    of classes are returned without a body.
+    """
+    if line.startswith(('def ', 'async ', 'class ')):
+        match = _HEADER_REGEX.match(line)
+        if match is not None:
+            if line.startswith('class '):
+                return match.group(1) + ':'
+            return match.group(1) + ': pass'
+        match = _DEFINITION_REGEX.match(line)
+        if match is None:
+            return ''
+        elif match.group(1) == 'def':
+            return match.group(0) + '(*args, **kwargs): pass'
+        return match.group(0) + ':'
+    elif _is_single_line_statement(line):
+        if line.startswith(('import ', 'from ')):
+            return line
+        if line.startswith('@'):
+            # Decorators like @property change the type of a method.
+            return line
+        match = _ASSIGNMENT_REGEX.match(line)
+        return '' if match is None else line
+    else:
+        match = _ASSIGNMENT_REGEX.match(line)
+        if match is None or match.group(2) is None:
+            return ''
+        return '%s = %s)' % (match.group(1), match.group(2))
+
+
+def _is_single_line_statement(line):
+    return line.count('(') == line.count(')') \
+        and line.count('[') == line.count(']') \
+        and line.count('{') == line.count('}') \
+        and '"""' not in line and "'''" not in line \
+        and not line.rstrip().endswith('\\')
+
+
 def get_executable_nodes(node, last_added=False):
     """
     For static analysis.
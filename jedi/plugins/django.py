@@ -4,6 +4,7 @@ Module is used to infer Django model fields.
 from inspect import Parameter
 
 from jedi import debug
+from jedi.cache import modification_cache
 from jedi.inference.cache import inference_state_function_cache
 from jedi.inference.base_value import ValueSet, iterator_to_value_set, ValueWrapper
 from jedi.inference.filters import DictFilter, AttributeOverwrite
@@ -40,6 +41,8 @@ mapping = {
 _FILTER_LIKE_METHODS = ('create', 'filter', 'exclude', 'update', 'get',
                         'get_or_create', 'update_or_create')
 
+_MAX_INDEXED_MODELS = 1000
+
 
 @inference_state_function_cache()
 def _get_deferred_attributes(inference_state):
@@ -200,7 +203,7 @@ def tree_name_to_values(func):
     return wrapper
 
 
-def _find_fields(cls):
+def _infer_fields(cls):
     for name in _new_dict_filter(cls, is_instance=False).values():
         for value in name.infer():
             if value.name.get_qualified_names(include_module_names=True) \
@@ -208,6 +211,33 @@ def _find_fields(cls):
                 yield name
 
 
+@modification_cache(maxsize=_MAX_INDEXED_MODELS)
+def _get_field_names(cls):
+    """
+    Finding the fields of a model means inferring all its attributes, so the
+    names of the fields are saved until the modules of the model or of its
+    bases are modified. Models in the module that is being edited are not
+    saved.
+    """
+    file_io = cls.get_root_context().get_value().file_io
+    if file_io is None or file_io.path is None \
+            or file_io.path == cls.inference_state.script_path:
+        yield None  # Don't cache!
+    else:
+        yield (cls.inference_state.environment.executable,
+               str(file_io.path), cls.tree_node.start_pos)
+    yield frozenset(name.string_name for name in _infer_fields(cls))
+    paths = {c.get_root_context().py__file__() for c in cls.py__mro__()}
+    yield paths - {None}
+
+
+def _find_fields(cls):
+    field_names = _get_field_names(cls)
+    for name in _new_dict_filter(cls, is_instance=False).values():
+        if name.string_name in field_names:
+            yield name
+
+
 def _get_signatures(cls):
     return [DjangoModelSignature(cls, field_names=list(_find_fields(cls)))]
 
@@ -1,6 +1,9 @@
+import configparser
+import os
 from pathlib import Path
 
 from parso.tree import search_ancestor
+from jedi.cache import memoize_method, modification_cache
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
@@ -15,6 +18,8 @@ _PYTEST_FIXTURE_MODULES = [
     ('_pytest', 'pytester'),
 ]
 
+_MAX_INDEXED_MODULES = 100
+
 
 def execute(callback):
     def wrapper(value, arguments):
@@ -139,13 +144,105 @@ def _iter_pytest_modules(module_context, skip_own_module=False):
                     pass
             folder = folder.get_parent_folder()
 
-    for names in _PYTEST_FIXTURE_MODULES:
-        for module_value in module_context.inference_state.import_module(names):
+    inference_state = module_context.inference_state
+    plugin_modules = _find_pytest_plugin_modules(tuple(inference_state.get_sys_path()))
+    for names in _PYTEST_FIXTURE_MODULES + plugin_modules:
+        for module_value in inference_state.import_module(names):
             yield module_value.as_context()
 
 
+@modification_cache(maxsize=10)
+def _find_pytest_plugin_modules(sys_path):
+    """
+    Finds the pytest plugins that are registered with the ``pytest11`` entry
+    point, see
+    https://docs.pytest.org/en/stable/how-to/writing_plugins.html#setuptools-entry-points
+
+    The plugins have to be installed in the environment that is inferred, not
+    in the one jedi is running in. Therefore the metadata of the packages on
+    the environment's sys path is read directly. Installing, upgrading or
+    removing a package modifies the folder it's in, so the plugins are only
+    searched again if a folder of the sys path is modified.
+    """
+    yield sys_path
+    modules = []
+    for path in sys_path:
+        try:
+            file_names = os.listdir(path)
+        except OSError:
+            continue
+        for file_name in file_names:
+            if file_name.endswith(('.dist-info', '.egg-info')):
+                modules += _read_pytest_entry_points(
+                    os.path.join(path, file_name, 'entry_points.txt')
+                )
+    yield modules
+    yield sys_path
+
+
+def _read_pytest_entry_points(path):
+    parser = configparser.ConfigParser(delimiters=('=',), interpolation=None)
+    try:
+        parser.read(path, encoding='utf-8')
+    except (configparser.Error, UnicodeDecodeError):
+        return []
+    if not parser.has_section('pytest11'):
+        return []
+    # Values look like ``module:attr [extra]``, only the module is needed.
+    return [
+        value.split('[')[0].split(':')[0].strip().split('.')
+        for value in parser['pytest11'].values()
+    ]
+
+
+def _get_fixture_positions(module_context):
+    """
+    Returns the start positions of the fixture names in a module. Finding out
+    if a decorator is a fixture needs type inference, therefore the results
+    are saved until the module is modified. Returns None for modules that are
+    not saved, like the one that is being edited.
+    """
+    inference_state = module_context.inference_state
+    file_io = module_context.get_value().file_io
+    if file_io is None or file_io.path is None \
+            or file_io.path == inference_state.script_path:
+        return None
+    return _index_fixture_positions(module_context, str(file_io.path))
+
+
+@modification_cache(maxsize=_MAX_INDEXED_MODULES)
+def _index_fixture_positions(module_context, path):
+    yield module_context.inference_state.environment.executable, path
+    fixture_filter = FixtureFilter(module_context, use_index=False)
+    yield frozenset(
+        name.start_pos
+        for names in module_context.tree_node.get_used_names().values()
+        for name in fixture_filter._filter(names)
+    )
+    yield [path]
+
+
 class FixtureFilter(ParserTreeFilter):
+    def __init__(self, parent_context, use_index=True):
+        super().__init__(parent_context)
+        self._use_index = use_index
+
+    @memoize_method
+    def _get_indexed_positions(self):
+        # Only calculated once names are looked up, many filters are never
+        # used.
+        if not self._use_index:
+            return None
+        return _get_fixture_positions(self.parent_context)
+
     def _filter(self, names):
+        fixture_positions = self._get_indexed_positions()
+        if fixture_positions is not None:
+            for name in super()._filter(names):
+                if name.start_pos in fixture_positions:
+                    yield name
+            return
+
         for name in super()._filter(names):
             funcdef = name.parent
             # Class fixtures are not supported
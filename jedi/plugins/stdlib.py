@@ -11,6 +11,7 @@ compiled module that returns the types for C-builtins.
 """
 import parso
 import os
+from functools import lru_cache
 from inspect import Parameter
 
 from jedi import debug
@@ -447,26 +448,36 @@ def collections_namedtuple(value, arguments, callback):
     else:
         return NO_VALUES
 
+    module, code_lines = _parse_namedtuple(inference_state.grammar, name, tuple(fields))
+    generated_class = next(module.iter_classdefs())
+    parent_context = ModuleValue(
+        inference_state, module,
+        code_lines=code_lines,
+    ).as_context()
+
+    return ValueSet([ClassValue(inference_state, parent_context, generated_class)])
+
+
+@lru_cache(maxsize=1000)
+def _parse_namedtuple(grammar, name, fields):
+    """
+    The class template is long and the generated class only depends on the
+    name and the fields. Every new Script infers the same namedtuple calls
+    again, so the parsed classes are shared.
+    """
     # Build source code
     code = _NAMEDTUPLE_CLASS_TEMPLATE.format(
         typename=name,
-        field_names=tuple(fields),
+        field_names=fields,
         num_fields=len(fields),
-        arg_list=repr(tuple(fields)).replace("'", "")[1:-1],
+        arg_list=repr(fields).replace("'", "")[1:-1],
         repr_fmt='',
         field_defs='\n'.join(_NAMEDTUPLE_FIELD_TEMPLATE.format(index=index, name=name)
                              for index, name in enumerate(fields))
     )
 
     # Parse source code
-    module = inference_state.grammar.parse(code)
-    generated_class = next(module.iter_classdefs())
-    parent_context = ModuleValue(
-        inference_state, module,
-        code_lines=parso.split_lines(code, keepends=True),
-    ).as_context()
-
-    return ValueSet([ClassValue(inference_state, parent_context, generated_class)])
+    return grammar.parse(code), parso.split_lines(code, keepends=True)
 
 
 class PartialObject(ValueWrapper):
@@ -29,6 +29,7 @@ Parser
 ~~~~~~
 
 .. autodata:: fast_parser
+.. autodata:: prefetch_imports
 
 
 Dynamic stuff
@@ -44,6 +45,10 @@ Caching
 ~~~~~~~
 
 .. autodata:: call_signatures_validity
+.. autodata:: completion_cache_validity
+.. autodata:: parser_cache_size
+.. autodata:: save_completion_cache
+.. autodata:: save_docstring_cache
 
 
 """
@@ -101,14 +106,37 @@ parse the parts again that have changed, while reusing the rest of the syntax
 tree.
 """
 
+prefetch_imports = False
+"""
+If enabled, a :class:`.Script` follows the imports of its module in a
+background thread right after it was created. This parses the imported modules
+(and their stubs) so they are usually in the parser cache by the time the
+next completion needs them. There is at most one such thread per project and
+environment and it stops as soon as a script is used.
+"""
+
 _cropped_file_size = int(10e6)  # 1 Megabyte
 """
 Jedi gets extremely slow if the file size exceed a few thousand lines.
-To avoid getting stuck completely Jedi crops the file at some point.
+To avoid getting stuck completely Jedi crops the file at some point. After that
+point only the top-level definitions are kept (without their bodies).
 
 One megabyte of typical Python code equals about 20'000 lines of code.
 """
 
+_windowed_file_size = None
+"""
+Scripts bigger than this are cropped like files bigger than
+:data:`_cropped_file_size`, but nothing is kept before the cut. Requests with a
+position (e.g. completions) parse the top-level statement at that position
+completely as well. Requests that need the whole file (e.g. references and
+refactorings) parse it completely.
+
+``None`` (the default) turns this off. Functions outside of the statement at
+the position lose their bodies, so their return types are only known if they
+are annotated.
+"""
+
 # ----------------
 # Dynamic Stuff
 # ----------------
@@ -150,5 +178,38 @@ This improves autocompletion for libraries that use ``setattr`` or
 call_signatures_validity = 3.0
 """
 Finding function calls might be slow (0.1-0.5s). This is not acceptible for
-normal writing. Therefore cache it for a short time.
+normal writing. Therefore signatures are cached until the code around the call
+or the modules of the called function are modified, but at most for this many
+seconds. Other modules the signatures depend on (e.g. of base classes) are not
+checked for modifications.
+"""
+
+completion_cache_validity = 3.0
+"""
+The names of ``foo`` in a completion of ``foo.bar`` are cached for a short
+time, because they don't change while the name after the dot is being typed.
+"""
+
+parser_cache_size = None
+"""
+The maximum amount of parsed modules that are kept in memory, e.g. ``1000``.
+If there are more, the ones that were used least recently are removed (when a
+:class:`.Script` is created). Modules that are removed are loaded from the
+cache in :data:`cache_directory` if they are needed again. The code of the
+latest scripts is not saved there, so it is never removed. By default this is
+left to parso, which removes the modules that were not used for ten minutes
+once it has cached a few hundred modules.
+"""
+
+save_completion_cache = True
+"""
+The types and docstrings of completions of huge modules like numpy are saved
+in :data:`cache_directory`, so that other processes don't have to infer them
+again.
+"""
+
+save_docstring_cache = True
+"""
+The types that are found in docstrings are saved in :data:`cache_directory`,
+so that other processes don't have to search the docstrings again.
 """
@@ -8,11 +8,17 @@ arguments are recorded to ``./record.json`` (specified by --record)::
 
     ./sith.py random /path/to/sourcecode
 
-Redo recorded exception::
+Time random operations and record the slowest ones (including work counters
+of the inference state) to ``./record.json``::
+
+    ./sith.py perf /path/to/sourcecode
+
+Redo recorded exception (or the slowest recorded operation of a perf run; use
+``--index`` to pick another one and ``--profile`` to run it under cProfile)::
 
     ./sith.py redo
 
-Show recorded exception::
+Show recorded exception or slow operations::
 
     ./sith.py show
 
@@ -27,7 +33,8 @@ many text editors, including Emacs).
 
 Usage:
   sith.py [--pdb|--ipdb|--pudb] [-d] [-n=<nr>] [-f] [--record=<file>] random [-s] [<path>]
-  sith.py [--pdb|--ipdb|--pudb] [-d] [-f] [--record=<file>] redo
+  sith.py [-d] [-n=<nr>] [-f] [--record=<file>] [--top=<nr>] perf [-s] [<path>]
+  sith.py [--pdb|--ipdb|--pudb] [-d] [-f] [--record=<file>] redo [--profile] [--index=<nr>]
   sith.py [--pdb|--ipdb|--pudb] [-d] [-f] run <operation> <path> <line> <column>
   sith.py show [--record=<file>]
   sith.py -h | --help
@@ -37,6 +44,9 @@ Options:
   --record=<file>       Exceptions are recorded in here [default: record.json].
   -f, --fs-cache        By default, file system cache is off for reproducibility.
   -n, --maxtries=<nr>   Maximum of random tries [default: 100]
+  --top=<nr>            Number of slowest operations to record [default: 10]
+  --index=<nr>          Which recorded slow operation to redo [default: 0]
+  --profile             Run the operation under cProfile and print the stats.
   -d, --debug           Jedi print debugging when an error is raised.
   -s                    Shows the path/line numbers of every completion before it starts.
   --pdb                 Launch pdb when error is raised.
@@ -46,10 +56,12 @@ Options:
 
 from docopt import docopt  # type: ignore[import]
 
+import cProfile
 import json
 import os
 import random
 import sys
+import time
 import traceback
 
 import jedi
@@ -76,7 +88,8 @@ class SourceFinder(object):
 
 
 class TestCase(object):
-    def __init__(self, operation, path, line, column, traceback=None):
+    def __init__(self, operation, path, line, column, traceback=None,
+                 timing=None, counters=None):
         if operation not in self.operations:
             raise ValueError("%s is not a valid operation" % operation)
 
@@ -86,13 +99,28 @@ class TestCase(object):
         self.line = line
         self.column = column
         self.traceback = traceback
+        self.timing = timing
+        self.counters = counters
 
     @classmethod
-    def from_cache(cls, record):
+    def from_cache(cls, record, index=0):
         with open(record) as f:
             args = json.load(f)
+        if isinstance(args, dict):
+            # A record of a perf run, sorted by the slowest operation.
+            return cls(**args['perf'][index])
         return cls(*args)
 
+    def as_perf_record(self):
+        return dict(
+            operation=self.operation,
+            path=self.path,
+            line=self.line,
+            column=self.column,
+            timing=self.timing,
+            counters=self.counters,
+        )
+
     # Changing this? Also update the module docstring above.
     operations = ['complete', 'goto', 'infer', 'get_references', 'get_signatures']
 
@@ -117,15 +145,35 @@ class TestCase(object):
         column = random.randint(0, line_len)
         return cls(operation, path, line, column)
 
-    def run(self, debugger, record=None, print_result=False):
+    def _run_operation(self):
+        with open(self.path) as f:
+            self.script = jedi.Script(f.read(), path=self.path)
+        kwargs = {}
+        if self.operation == 'goto':
+            kwargs['follow_imports'] = random.choice([False, True])
+
+        self.objects = getattr(self.script, self.operation)(self.line, self.column, **kwargs)
+
+    def _collect_counters(self):
+        inference_state = self.script._inference_state
+        return dict(
+            function_executions=inference_state.execution_recursion_detector._execution_count,
+            memoized_results=sum(len(c) for c in inference_state.memoize_cache.values()),
+            loaded_modules=len(inference_state.module_cache._name_cache),
+            inferred_elements=sum(inference_state.inferred_element_counts.values()),
+            results=len(self.objects),
+        )
+
+    def run(self, debugger, record=None, print_result=False, profile=False):
         try:
-            with open(self.path) as f:
-                self.script = jedi.Script(f.read(), path=self.path)
-            kwargs = {}
-            if self.operation == 'goto':
-                kwargs['follow_imports'] = random.choice([False, True])
-
-            self.objects = getattr(self.script, self.operation)(self.line, self.column, **kwargs)
+            start = time.perf_counter()
+            if profile:
+                cProfile.runctx('self._run_operation()', globals(), locals(),
+                                sort='cumulative')
+            else:
+                self._run_operation()
+            self.timing = time.perf_counter() - start
+            self.counters = self._collect_counters()
             if print_result:
                 print("{path}: Line {line} column {column}".format(**self.__dict__))
                 self.show_location(self.line, self.column)
@@ -173,6 +221,14 @@ class TestCase(object):
             if os.path.abspath(completion.module_path) == os.path.abspath(self.path):
                 self.show_location(completion.line, completion.column)
 
+    def show_timing(self):
+        print(("{timing:.3f}s for Script(...).{operation}() with\n"
+               "\tpath:   {path}\n"
+               "\tline:   {line}\n"
+               "\tcolumn: {column}").format(**self.__dict__))
+        for name, value in sorted((self.counters or {}).items()):
+            print("\t%s: %s" % (name, value))
+
     def show_errors(self):
         sys.stderr.write(self.traceback)
         print(("Error with running Script(...).{operation}() with\n"
@@ -181,6 +237,39 @@ class TestCase(object):
                "\tcolumn: {column}").format(**self.__dict__))
 
 
+def show_record(record):
+    with open(record) as f:
+        content = json.load(f)
+    if isinstance(content, dict):
+        for i, args in enumerate(content['perf']):
+            print('%s: ' % i, end='')
+            TestCase(**args).show_timing()
+    else:
+        TestCase(*content).show_errors()
+
+
+def run_perf(path, debugger, record, maxtries, top, show=False):
+    slowest = []
+    for _ in range(maxtries):
+        t = TestCase.generate(path)
+        if show:
+            print('%s %s %s %s ' % (t.operation, t.path, t.line, t.column))
+        else:
+            print('.', end='')
+        sys.stdout.flush()
+        t.run(debugger, record)
+        slowest.append(t)
+        slowest.sort(key=lambda t: t.timing, reverse=True)
+        del slowest[top:]
+
+        # Write the record after every run, so an interrupted run is not lost.
+        with open(record, 'w') as f:
+            json.dump({'perf': [t.as_perf_record() for t in slowest]}, f, indent=2)
+    print()
+    for t in slowest:
+        t.show_timing()
+
+
 def main(arguments):
     debugger = 'pdb' if arguments['--pdb'] else \
                'ipdb' if arguments['--ipdb'] else \
@@ -191,12 +280,22 @@ def main(arguments):
     if arguments['--debug']:
         jedi.set_debug_function()
 
-    if arguments['redo'] or arguments['show']:
-        t = TestCase.from_cache(record)
-        if arguments['show']:
-            t.show_errors()
-        else:
-            t.run(debugger)
+    if arguments['show']:
+        show_record(record)
+    elif arguments['redo']:
+        t = TestCase.from_cache(record, int(arguments['--index']))
+        t.run(debugger, profile=arguments['--profile'])
+        if t.timing is not None:
+            t.show_timing()
+    elif arguments['perf']:
+        run_perf(
+            arguments['<path>'] or '.',
+            debugger,
+            record,
+            maxtries=int(arguments['--maxtries']),
+            top=int(arguments['--top']),
+            show=arguments['-s'],
+        )
     elif arguments['run']:
         TestCase(
             arguments['<operation>'], arguments['<path>'],
@@ -395,3 +395,17 @@ some_other_dct['a']
 some_other_dct['x']
 #? set
 some_other_dct['c']
+
+# -----------------
+# dict update
+# -----------------
+
+dct = {'a': 1}
+dct.update({1.0: ''})
+dct.update(b=3)
+dct.setdefault(b'', 3)
+#? str() float() bytes()
+next(iter(dct))
+for key in dct:
+    #? str() float() bytes()
+    key
@@ -0,0 +1,4 @@
+"""
+A tiny stand-in for Django, so that the Django plugin can be tested without
+installing Django.
+"""
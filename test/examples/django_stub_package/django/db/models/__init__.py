@@ -0,0 +1,2 @@
+from django.db.models.base import Model
+from django.db.models.fields import Field, CharField, IntegerField
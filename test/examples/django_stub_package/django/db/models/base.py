@@ -0,0 +1,6 @@
+class ModelBase(type):
+    pass
+
+
+class Model(metaclass=ModelBase):
+    pass
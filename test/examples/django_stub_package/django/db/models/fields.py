@@ -0,0 +1,10 @@
+class Field:
+    pass
+
+
+class CharField(Field):
+    pass
+
+
+class IntegerField(Field):
+    pass
@@ -3,6 +3,7 @@ Test all things related to the ``jedi.api`` module.
 """
 
 import os
+import threading
 from textwrap import dedent
 
 import pytest
@@ -10,6 +11,10 @@ from pytest import raises
 from parso import cache
 
 from jedi import preload_module
+from jedi import settings
+from jedi import api
+from jedi.api import _warm_parser_cache
+from jedi.file_io import FileIO
 from jedi.inference.gradual import typeshed
 from test.helpers import test_dir, get_example_dir
 
@@ -41,6 +46,87 @@ def test_preload_modules():
         cache.parser_cache.update(old_cache)
 
 
+@pytest.fixture
+def empty_parser_cache():
+    old_cache = cache.parser_cache.copy()
+    cache.parser_cache.clear()
+    yield
+    cache.parser_cache.clear()
+    cache.parser_cache.update(old_cache)
+
+
+def test_preload_modules_progress(empty_parser_cache, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'cache_directory', str(tmp_path))
+    progress = []
+
+    def callback(module_name, loaded_count, total_count, seconds):
+        assert seconds >= 0
+        progress.append((module_name, loaded_count, total_count))
+
+    preload_module('types', 'token', progress_callback=callback, processes=2)
+    # The modules are loaded in other processes first, in any order.
+    assert sorted(progress[:2]) == [('token', 1, 4), ('types', 2, 4)] \
+        or sorted(progress[:2]) == [('token', 2, 4), ('types', 1, 4)]
+    assert progress[2:] == [('types', 3, 4), ('token', 4, 4)]
+
+
+def test_warm_parser_cache(empty_parser_cache, environment, monkeypatch, tmp_path):
+    class Environment:
+        def __getattr__(self, name):
+            return getattr(environment, name)
+
+        def get_sys_path(self):
+            return [str(tmp_path.joinpath('sys_path'))]
+
+    tmp_path.joinpath('sys_path', 'pkg').mkdir(parents=True)
+    module_path = tmp_path.joinpath('sys_path', 'pkg', 'mod.py')
+    module_path.write_text('def foo(): pass\n')
+    monkeypatch.setattr(typeshed, 'TYPESHED_PATH', tmp_path.joinpath('typeshed'))
+    monkeypatch.setattr(typeshed, 'DJANGO_INIT_PATH', tmp_path.joinpath('a', 'b', 'c'))
+    monkeypatch.setattr(settings, 'cache_directory', str(tmp_path.joinpath('cache')))
+
+    progress = []
+    _warm_parser_cache(Environment(), processes=1,
+                       progress_callback=lambda *args: progress.append(args))
+    assert progress == [(str(module_path), 1, 1)]
+
+    grammar = environment.get_grammar()
+    module = cache.load_module(grammar._hashed, FileIO(str(module_path)),
+                               tmp_path.joinpath('cache'))
+    assert module.get_code() == 'def foo(): pass\n'
+
+
+def test_prefetch_imports(Script, empty_parser_cache, monkeypatch):
+    monkeypatch.setattr(settings, 'prefetch_imports', True)
+    monkeypatch.setattr(api, '_prefetch_threads', {})
+    script = Script('import token\nfrom json import decoder\n')
+    script._prefetch_thread.join()
+    paths = [str(path) for grammar_cache in cache.parser_cache.values()
+             for path in grammar_cache if path is not None]
+    assert any(path.endswith('token.py') for path in paths)
+    assert any(path.endswith(os.path.join('json', 'decoder.py')) for path in paths)
+    assert any(path.endswith(os.path.join('json', 'decoder.pyi')) for path in paths)
+
+
+def test_prefetch_imports_once(Script, monkeypatch):
+    monkeypatch.setattr(api, '_prefetch_threads', {})
+    script = Script('import token\n')
+    monkeypatch.setattr(settings, 'prefetch_imports', True)
+    thread = threading.Thread(target=threading.Event().wait, args=(10,), daemon=True)
+    thread.start()
+    stop_event = threading.Event()
+    api._prefetch_threads[script._get_prefetch_key()] = thread, stop_event
+
+    # There is already a thread prefetching for this project.
+    script = Script('import token\n')
+    assert script._prefetch_thread is None
+    assert not stop_event.is_set()
+
+    # Requests stop prefetching.
+    script.complete()
+    assert stop_event.is_set()
+
+
 def test_empty_script(Script):
     assert Script('')
 
@@ -323,13 +409,14 @@ def test_docstrings_for_completions(Script):
 
 def test_fuzzy_completion(Script):
     script = Script('string =  "hello"\nstring.upper')
-    assert ['isupper',
-            'upper'] == [comp.name for comp in script.complete(fuzzy=True)]
+    # The better match comes first.
+    assert ['upper',
+            'isupper'] == [comp.name for comp in script.complete(fuzzy=True)]
 
 
 def test_math_fuzzy_completion(Script, environment):
     script = Script('import math\nmath.og')
-    expected = ['copysign', 'log', 'log10', 'log1p', 'log2']
+    expected = ['log', 'log10', 'log1p', 'log2', 'copysign']
     completions = script.complete(fuzzy=True)
     assert expected == [comp.name for comp in completions]
     for c in completions:
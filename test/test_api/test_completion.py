@@ -5,7 +5,8 @@ from textwrap import dedent
 import pytest
 
 from ..helpers import root_dir
-from jedi.api.helpers import _start_match, _fuzzy_match
+from jedi.api import classes
+from jedi.api.helpers import _start_match, _fuzzy_match, fuzzy_score
 
 
 def test_in_whitespace(Script):
@@ -394,13 +395,34 @@ def test_fuzzy_match():
     assert _fuzzy_match('Condition', 'ii')
     assert not _fuzzy_match('Condition', 'Ciito')
     assert _fuzzy_match('Condition', 'Cdiio')
+    assert _fuzzy_match('Condition', '')
+
+
+def test_fuzzy_score():
+    assert fuzzy_score('Condition', 'p') is None
+    assert fuzzy_score('Condition', 'cond') is None
+    assert fuzzy_score('Condition', 'cond', case_insensitive=True) is not None
+    # Starts of snake_case and camelCase parts are better than other
+    # characters.
+    assert fuzzy_score('get_value', 'gv') > fuzzy_score('give', 'gv')
+    assert fuzzy_score('getValue', 'gv', case_insensitive=True) \
+        > fuzzy_score('give', 'gv', case_insensitive=True)
+    assert fuzzy_score('value', 'val') > fuzzy_score('eval', 'val')
+
+
+def test_fuzzy_completion_order(Script):
+    code = 'def give(): pass\ndef get_value(): pass\ndef bagview(): pass\ngv'
+    assert [c.name for c in Script(code).complete(fuzzy=True)] \
+        == ['get_value', 'give', 'bagview']
+    assert [c.name for c in Script(code).complete_search('gv', fuzzy=True)] \
+        == ['get_value', 'give', 'bagview']
 
 
 def test_ellipsis_completion(Script):
     assert Script('...').complete() == []
 
 
-def test_completion_cache(Script, module_injector):
+def test_completion_cache(Script, module_injector, monkeypatch):
     """
     For some modules like numpy, tensorflow or pandas we cache docstrings and
     type to avoid them slowing us down, because they are huge.
@@ -412,6 +434,13 @@ def test_completion_cache(Script, module_injector):
     assert c.type == 'function'
     assert c.docstring() == 'foo(a)\n\ndoc'
 
+    # The second lookup uses the cache and doesn't infer anything.
+    with monkeypatch.context() as m:
+        m.setattr(classes.Completion, '_get_cache', lambda self: 1 / 0)
+        c, = script.complete()
+        assert c.type == 'function'
+        assert c.docstring() == 'foo(a)\n\ndoc'
+
     code = dedent('''\
         class foo:
             'doc2'
@@ -420,14 +449,68 @@ def test_completion_cache(Script, module_injector):
         ''')
     script = Script('import numpy; numpy.foo')
     module_injector(script._inference_state, ('numpy',), code)
-    # The outpus should still be the same
+    # The module is different, so the cache is not used.
     c, = script.complete()
     assert c.name == 'foo'
-    assert c.type == 'function'
-    assert c.docstring() == 'foo(a)\n\ndoc'
-    cls, = c.infer()
-    assert cls.type == 'class'
-    assert cls.docstring() == 'foo()\n\ndoc2'
+    assert c.type == 'class'
+    assert c.docstring() == 'foo()\n\ndoc2'
+
+
+def test_trailer_completion_cache(Script, monkeypatch):
+    from jedi.api.completion import Completion
+    complete_trailer = Completion._complete_trailer
+    calls = []
+
+    def _complete_trailer(self, previous_leaf):
+        calls.append(previous_leaf.value)
+        return complete_trailer(self, previous_leaf)
+
+    monkeypatch.setattr(Completion, '_complete_trailer', _complete_trailer)
+
+    def complete(code):
+        script = Script(code, path='trailer_cache.py')
+        return [c.name for c in script.complete(1, len(code.split('\n')[0]))]
+
+    assert 'real' in complete('x = 1; x.')
+    assert complete('x = 1; x.r') == ['real']
+    assert complete('x = 1; x.re') == ['real']
+    assert complete('x = 1; x.') == complete('x = 1; x.')
+    assert calls == ['x']
+
+    assert complete('x = ""; x.rep') == ['replace']
+    assert calls == ['x', 'x']
+
+    assert complete('x = ""; x.rep\n') == ['replace']
+    assert calls == ['x', 'x', 'x']
+
+    # Changing a definition on another line changes the completions.
+    code = 'class A:\n    def %s(self): pass\nA().b'
+    for name in ('bar', 'baz'):
+        script = Script(code % name, path='trailer_cache.py')
+        assert [c.name for c in script.complete(3, 5)] == [name]
+    assert calls == ['x', 'x', 'x', ')', ')']
+
+
+def test_completion_cache_on_disk(monkeypatch, environment):
+    from jedi.api import completion_cache
+    key = completion_cache.create_module_key('numpy', None, environment)
+    completion_cache.save_entry(key, 'foo', ('function', 'foo(a)', 'doc'))
+
+    # Other processes load the entries from the disk.
+    monkeypatch.setattr(completion_cache, '_cache', {})
+    assert completion_cache.get_docstring(key, 'foo', lambda: 1 / 0) == 'doc'
+    assert completion_cache.get_type(key, 'foo', lambda: 1 / 0) == 'function'
+
+    # Upgrading a module removes the files of the old version.
+    path = completion_cache._get_pickle_log(key).path
+    monkeypatch.setattr(completion_cache, '_cache', {})
+    new_key = key[:-1] + ('1' if key[-1] == '0' else '0')
+    assert completion_cache.get_type(new_key, 'foo', lambda: ('class', '', '')) == 'class'
+    assert not os.path.exists(path)
+
+    monkeypatch.setattr(completion_cache, '_cache', {})
+    monkeypatch.setattr('jedi.settings.save_completion_cache', False)
+    assert completion_cache.get_type(key, 'foo', lambda: ('class', '', '')) == 'class'
 
 
 @pytest.mark.parametrize('module', ['typing', 'os'])
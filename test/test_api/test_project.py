@@ -5,8 +5,10 @@ import pytest
 
 from ..helpers import get_example_dir, set_cwd, root_dir, test_dir
 from jedi import Interpreter
-from jedi.api import Project, get_default_project
+from jedi.file_io import FileIO
+from jedi.api import Project, get_default_project, search_index
 from jedi.api.project import _is_potential_project, _CONTAINS_POTENTIAL_PROJECT
+from jedi.inference import references
 
 
 def test_django_default_project(Script):
@@ -179,3 +181,63 @@ def test_is_potential_project(path, expected):
             expected = False
 
     assert _is_potential_project(path) == expected
+
+
+def test_bytes_prefilter(tmp_path):
+    tmp_path.joinpath('empty.py').write_text('')
+    tmp_path.joinpath('other.py').write_text('def bar(): pass\n')
+    tmp_path.joinpath('unicode.py').write_text('éfoo_bar = 1\n', encoding='utf-8')
+    tmp_path.joinpath('latin.py').write_bytes(
+        b'# coding: latin-1\nfoo_bar = "\xe9"\n'
+    )
+    defs = Project(tmp_path).search('foo_bar')
+    assert [(d.module_name, d.name) for d in defs] == [('latin', 'foo_bar')]
+
+
+def test_project_word_index(tmp_path, monkeypatch):
+    monkeypatch.setattr('jedi.settings.cache_directory', str(tmp_path.joinpath('cache')))
+    monkeypatch.setattr(search_index, '_indexes', {})
+    project_path = tmp_path.joinpath('project')
+    project_path.mkdir()
+    project_path.joinpath('a.py').write_text('def foo_bar(): pass\n')
+    project_path.joinpath('b.py').write_text('import os\n')
+    a, b = [FileIO(str(project_path.joinpath(name))) for name in ('a.py', 'b.py')]
+
+    # Files are only indexed while they are searched.
+    index = search_index.get_search_index(project_path)
+    assert index.might_contain(b, 'foo_bar')
+    defs = Project(project_path).search('foo_bar')
+    assert [(d.module_name, d.name) for d in defs] == [('a', 'foo_bar')]
+    assert index.might_contain(a, 'foo_bar')
+    assert not index.might_contain(b, 'foo_bar')
+    assert index.might_contain(b, 'os')
+    # Non-ASCII names are not indexed.
+    assert index.might_contain(b, 'é')
+
+    # The index is saved.
+    monkeypatch.setattr(search_index, '_indexes', {})
+    index = search_index.get_search_index(project_path)
+    assert not index.might_contain(b, 'foo_bar')
+
+    project_path.joinpath('b.py').write_text('from a import foo_bar\n')
+    os.utime(project_path.joinpath('b.py'), (1, 1))
+    assert index.might_contain(b, 'foo_bar')
+
+
+def test_project_word_index_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr('jedi.settings.cache_directory', str(tmp_path.joinpath('cache')))
+    monkeypatch.setattr(search_index, '_indexes', {})
+    monkeypatch.setattr(references, '_OPENED_FILE_LIMIT', 1)
+    project_path = tmp_path.joinpath('project')
+    project_path.mkdir()
+    for name in ('a', 'b'):
+        project_path.joinpath(name + '.py').write_text('x = 1\n')
+
+    # The limit of opened files still applies, so only one file is indexed
+    # per search.
+    index = search_index.get_search_index(project_path)
+    assert not list(Project(project_path).search('foo_bar'))
+    assert len(index._changed_shards) == 0
+    assert sum(len(shard) for shard in index._shards.values()) == 1
+    assert not list(Project(project_path).search('foo_bar'))
+    assert sum(len(shard) for shard in index._shards.values()) == 2
@@ -1,6 +1,14 @@
 """
 Test all things related to the ``jedi.cache`` module.
 """
+import os
+
+import parso
+import pytest
+from parso.cache import parser_cache
+
+from jedi import cache
+from jedi.cache import memoize_method
 
 
 def test_cache_get_signatures(Script):
@@ -27,3 +35,163 @@ def test_cache_get_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').get_signatures()[0].name == 'int'
+
+
+def test_memoize_method_with_slots():
+    class Slotted:
+        __slots__ = ('_memoize_method_dct', 'calls')
+
+        def __init__(self):
+            self.calls = 0
+
+        @memoize_method
+        def get(self, x):
+            self.calls += 1
+            return x * 2
+
+    obj = Slotted()
+    assert obj.get(2) == 4
+    assert obj.get(2) == 4
+    assert obj.get(3) == 6
+    assert obj.calls == 2
+
+
+def test_memoize_method_kwargs():
+    class Foo:
+        @memoize_method
+        def get(self, *args, **kwargs):
+            return args, kwargs
+
+    obj = Foo()
+    assert obj.get(x=1) == ((), {'x': 1})
+    # Looks like the key of the call above.
+    args = ((), frozenset({('x', 1)}))
+    assert obj.get(*args) == (args, {})
+
+
+def test_parser_cache_size(monkeypatch, tmp_path):
+    cache.clear_time_caches(delete_all=True)
+    grammar = parso.load_grammar()
+    paths = []
+    for i in range(4):
+        path = tmp_path.joinpath('mod%s.py' % i)
+        path.write_text('x = %s' % i)
+        grammar.parse(path=path, cache=True, cache_path=tmp_path)
+        paths.append(path)
+
+    def cached_paths():
+        return {p for m in parser_cache.values() for p in m}
+
+    for i, path in enumerate(paths):
+        parser_cache[grammar._hashed][path].last_used = i
+
+    monkeypatch.setattr('jedi.settings.parser_cache_size', 2)
+    cache.clear_time_caches()
+    assert cached_paths() == set(paths[2:])
+
+    # Removed modules are loaded again if they are needed.
+    module = grammar.parse(path=paths[0], cache=True, cache_path=tmp_path)
+    assert module.get_code() == 'x = 0'
+    assert cached_paths() == {paths[0], paths[2], paths[3]}
+
+
+def test_parser_cache_size_pinned_buffer(monkeypatch, Script, tmp_path):
+    cache.clear_time_caches(delete_all=True)
+    monkeypatch.setattr('jedi.settings.parser_cache_size', 1)
+    buffer_path = tmp_path.joinpath('buffer.py')
+    Script('import os\nos.path', path=buffer_path).infer()
+    cache.clear_time_caches()
+    assert [p for m in parser_cache.values() for p in m] == [buffer_path]
+
+
+def test_cache_signatures_modified_module(Script, tmp_path, monkeypatch):
+    from jedi import Project
+    from jedi.api import helpers
+    infer = helpers.infer
+    calls = []
+
+    def infer_and_count(*args):
+        calls.append(args)
+        return infer(*args)
+
+    monkeypatch.setattr(helpers, 'infer', infer_and_count)
+    tmp_path.joinpath('mod.py').write_text('def foo(a): pass\n')
+    os.utime(tmp_path.joinpath('mod.py'), (1, 1))
+    project = Project(tmp_path)
+
+    def params(code):
+        script = Script(code, path=tmp_path.joinpath('main.py'), project=project)
+        return [p.name for p in script.get_signatures()[0].params]
+
+    assert params('import mod; mod.foo(') == ['a']
+    assert params('import mod; mod.foo(1') == ['a']
+    assert len(calls) == 1
+
+    tmp_path.joinpath('mod.py').write_text('def foo(b): pass\n')
+    os.utime(tmp_path.joinpath('mod.py'), (2, 2))
+    assert params('import mod; mod.foo(1') == ['b']
+    assert len(calls) == 2
+
+    # Other modules are not checked, so signatures still expire.
+    monkeypatch.setattr('jedi.settings.call_signatures_validity', 0)
+    assert params('x = 1; import mod; mod.foo(1') == ['b']
+    assert params('x = 1; import mod; mod.foo(1') == ['b']
+    assert len(calls) == 4
+
+
+def test_time_cache():
+    time_cache = cache.TimeCache(maxsize=3)
+    for i in range(4):
+        time_cache.set(i, str(i), expiry=10 + i)
+    # The entry that expires first is removed.
+    assert len(time_cache) == 3
+    with pytest.raises(KeyError):
+        time_cache.get(0, now=0)
+    assert time_cache.get(1, now=0) == '1'
+    assert time_cache.get(3, now=12) == '3'
+    with pytest.raises(KeyError):
+        time_cache.get(2, now=12)
+
+    time_cache.set(1, 'new', expiry=20)
+    time_cache.remove_expired(now=15)
+    assert len(time_cache) == 1
+    assert time_cache.get(1, now=15) == 'new'
+    assert time_cache.get_stats() == dict(size=1, hits=3, misses=2, expired=2, evicted=1)
+
+
+def test_pickle_log(tmp_path):
+    path = str(tmp_path.joinpath('log.pkl'))
+    pickle_log = cache.PickleLog(path, max_size=10000)
+    assert pickle_log.load() == {}
+    pickle_log.append('a', 1)
+    pickle_log.append('b', 2)
+    pickle_log.append('a', 3)
+    assert pickle_log.load() == {'a': 3, 'b': 2}
+
+    # Broken records are skipped.
+    with open(path, 'ab') as f:
+        f.write(cache._RECORD_HEADER.pack(3) + b'xyz')
+    pickle_log.append('c', 4)
+    assert pickle_log.load() == {'a': 3, 'b': 2, 'c': 4}
+
+    # An incomplete record is cut off, so new records can be loaded again.
+    with open(path, 'ab') as f:
+        f.write(cache._RECORD_HEADER.pack(100) + b'xyz')
+    assert pickle_log.load() == {'a': 3, 'b': 2, 'c': 4}
+    pickle_log.append('d', 5)
+    assert pickle_log.load() == {'a': 3, 'b': 2, 'c': 4, 'd': 5}
+
+
+def test_pickle_log_max_size(tmp_path):
+    path = str(tmp_path.joinpath('log.pkl'))
+    pickle_log = cache.PickleLog(path, max_size=1000)
+    for i in range(100):
+        pickle_log.append(i, i)
+    assert os.path.getsize(path) > 1000
+
+    # The oldest records are left away.
+    dct = pickle_log.load()
+    assert os.path.getsize(path) <= 500
+    assert pickle_log.load() == dct
+    assert 99 in dct
+    assert 0 not in dct
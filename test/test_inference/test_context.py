@@ -16,3 +16,17 @@ def test_module__file__(Script, environment):
     def_, = Script('import antigravity; antigravity.__file__').infer()
     value = def_._name._value.get_safe_value()
     assert value.endswith('.pyi')
+
+
+def test_many_definitions_in_different_scopes(Script):
+    code = ''.join('def f%s():\n    x = %s\n    x\n' % (i, i) for i in range(50))
+    code += 'x = ""\nx = b""\nx\n'
+    lines = code.splitlines()
+    for i in range(50):
+        def_, = Script(code).infer(line=i * 3 + 3, column=4)
+        assert def_.name == 'int'
+        assert def_._name._value.get_safe_value() == i
+    def_, = Script(code).infer(line=len(lines), column=0)
+    assert def_.name == 'bytes'
+    def_, = Script(code).infer(line=len(lines) - 2, column=0)
+    assert def_.name == 'str'
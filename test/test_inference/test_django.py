@@ -0,0 +1,45 @@
+import os
+
+from jedi import Project
+from jedi.plugins import django
+from ..helpers import get_example_dir
+
+
+def test_model_field_index(Script, tmp_path, monkeypatch):
+    models = tmp_path.joinpath('models.py')
+    models.write_text('from django.db import models\n\n'
+                      'class Foo(models.Model):\n    name = models.CharField()\n')
+    os.utime(models, (1, 1))
+    # A small stand-in for Django is enough to run this without Django.
+    project = Project(tmp_path, added_sys_path=[
+        str(tmp_path),
+        get_example_dir('django_stub_package'),
+    ])
+
+    infer_fields = django._infer_fields
+    calls = []
+
+    def _infer_fields(cls):
+        calls.append(cls.py__name__())
+        return infer_fields(cls)
+
+    monkeypatch.setattr(django, '_infer_fields', _infer_fields)
+    # Don't reuse the signatures themselves.
+    monkeypatch.setattr('jedi.settings.call_signatures_validity', 0)
+
+    def params():
+        script = Script('from models import Foo\nFoo(', path=tmp_path.joinpath('views.py'),
+                        project=project)
+        return [p.name for p in script.get_signatures()[0].params]
+
+    assert params() == ['name']
+    assert calls == ['Foo']
+    # Other scripts use the field names of unmodified models.
+    assert params() == ['name']
+    assert calls == ['Foo']
+
+    models.write_text('from django.db import models\n\n'
+                      'class Foo(models.Model):\n    age = models.IntegerField()\n')
+    os.utime(models, (2, 2))
+    assert params() == ['age']
+    assert calls == ['Foo', 'Foo']
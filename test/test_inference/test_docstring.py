@@ -539,3 +539,44 @@ def test_property(name, docstring, goto_or_complete):
     ''')
     n, = goto_or_complete(code + 'Test().' + name)
     assert n.docstring() == docstring
+
+
+def test_docstring_type_cache(Script, monkeypatch):
+    from jedi.inference import docstrings
+    code = dedent('''
+        def f(x):
+            """:type x: str
+            :rtype: int"""
+            x.upp''')
+    search_param = docstrings._search_param_in_docstr
+    calls = []
+
+    def _search_param_in_docstr(*args):
+        calls.append(args)
+        return search_param(*args)
+
+    monkeypatch.setattr(docstrings, '_search_param_in_docstr', _search_param_in_docstr)
+    assert [c.name for c in Script(code).complete()] == ['upper']
+    assert [c.name for c in Script(code + '\nf("").re').complete()] == ['real']
+    assert len(calls) == 1
+
+    # Other processes load the type strings from the disk.
+    monkeypatch.setattr(docstrings, '_type_strings_cache', None)
+    assert [c.name for c in Script(code).complete()] == ['upper']
+    assert len(calls) == 1
+
+    # Only the most recently used type strings are kept in memory.
+    monkeypatch.setattr(docstrings, '_MAX_TYPE_STRINGS', 1)
+    assert [c.name for c in Script(code + '\nf("").re').complete()] == ['real']
+    assert len(docstrings._type_strings_cache[2]) == 1
+    assert len(calls) == 1
+
+
+def test_docstring_type_cache_not_saved(Script, monkeypatch, tmp_path):
+    from jedi.inference import docstrings
+    monkeypatch.setattr('jedi.settings.cache_directory', str(tmp_path))
+    monkeypatch.setattr('jedi.settings.save_docstring_cache', False)
+    monkeypatch.setattr(docstrings, '_type_strings_cache', None)
+    code = 'def f(x):\n    """:type x: str"""\n    x.upp'
+    assert [c.name for c in Script(code).complete()] == ['upper']
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,25 @@
+from jedi import Project
+from jedi.file_io import FileIO
+from jedi.inference import references
+
+
+def test_dynamic_params_from_all_calling_modules(Script, tmp_path):
+    (tmp_path / 'lib.py').write_text('def func(param):\n    return param\n')
+    (tmp_path / 'a.py').write_text('from lib import func\nfunc(1)\n')
+    (tmp_path / 'b.py').write_text('from lib import func\nfunc("")\n')
+    (tmp_path / 'c.py').write_text('# func is mentioned, but not called\n')
+
+    project = Project(tmp_path)
+    path = tmp_path / 'lib.py'
+    defs = Script(path=path, project=project).infer(line=2, column=12)
+    assert sorted(d.name for d in defs) == ['int', 'str']
+
+
+def test_called_names_cache_size(monkeypatch, tmp_path):
+    monkeypatch.setattr(references, '_called_names_cache', {})
+    monkeypatch.setattr(references, '_CALLED_NAMES_CACHE_SIZE', 1)
+    paths = [tmp_path / 'a.py', tmp_path / 'b.py']
+    for path in paths:
+        path.write_text('func(1)\n')
+        assert references._get_called_names(FileIO(str(path))) == {'func'}
+    assert list(references._called_names_cache) == [paths[1]]
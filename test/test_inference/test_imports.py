@@ -4,6 +4,8 @@ Tests".
 """
 
 import os
+import shutil
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -15,8 +17,9 @@ from jedi.inference import imports
 from jedi.api.project import Project
 from jedi.inference.gradual.conversion import _stub_to_python_value_set
 from jedi.inference.references import get_module_contexts_containing_name
-from ..helpers import get_example_dir, test_dir, test_dir_project, root_dir
+from jedi.inference.compiled.subprocess import functions
 from jedi.inference.compiled.subprocess.functions import _find_module_py33, _find_module
+from ..helpers import get_example_dir, test_dir, test_dir_project, root_dir
 
 THIS_DIR = os.path.dirname(__file__)
 
@@ -101,6 +104,28 @@ def test_correct_zip_package_behavior(Script, inference_state, environment, code
     assert value.py__package__() == []
 
 
+def test_zip_source_cache(tmp_path):
+    archive = tmp_path.joinpath('pkg.zip')
+    shutil.copy(pkg_zip_path, archive)
+    module_path = str(archive.joinpath('pkg', 'module.py'))
+
+    code, modified = functions._get_zip_source(str(archive), module_path)
+    assert isinstance(code, bytes)
+    assert modified == os.path.getmtime(archive)
+    _, infos = functions._zip_info_cache[str(archive)]
+    assert functions._get_zip_source(str(archive), module_path) == (code, modified)
+    assert functions._zip_info_cache[str(archive)][1] is infos
+    assert functions._get_zip_source(str(archive), module_path + 'x') == (None, modified)
+
+    with zipfile.ZipFile(archive, 'w') as new_zip_file:
+        new_zip_file.writestr('pkg/module.py', 'foo = 1\n')
+    os.utime(archive, (0, 0))
+    assert functions._get_zip_source(str(archive), module_path) == (b'foo = 1\n', 0)
+    # The archive is not kept open.
+    os.remove(archive)
+    assert functions._get_zip_source(str(archive), module_path) == (None, None)
+
+
 def test_find_module_not_package_zipped(Script, inference_state, environment):
     path = get_example_dir('zipped_imports', 'not_pkg.zip')
     sys_path = environment.get_sys_path() + [path]
@@ -0,0 +1,65 @@
+import os
+
+from jedi import Project
+from jedi.plugins import pytest as pytest_plugin
+
+
+def test_fixture_index(Script, tmp_path, monkeypatch):
+    conftest = tmp_path.joinpath('conftest.py')
+    conftest.write_text('import pytest\n\n@pytest.fixture\ndef my_fixture():\n    return 1\n')
+    os.utime(conftest, (1, 1))
+    test_path = tmp_path.joinpath('test_foo.py')
+    project = Project(tmp_path, added_sys_path=[str(tmp_path)])
+
+    indexed_paths = set()
+    is_fixture = pytest_plugin.FixtureFilter._is_fixture
+
+    def _is_fixture(self, decorated):
+        indexed_paths.add(str(self.parent_context.py__file__()))
+        return is_fixture(self, decorated)
+
+    monkeypatch.setattr(pytest_plugin.FixtureFilter, '_is_fixture', _is_fixture)
+
+    def complete(code):
+        script = Script(code, path=test_path, project=project)
+        return [c.name for c in script.complete(1, code.index(')'))]
+
+    assert complete('def test_foo(my_): pass') == ['my_fixture']
+    assert str(conftest) in indexed_paths
+
+    # Other scripts use the fixture positions of unmodified modules.
+    indexed_paths.clear()
+    assert complete('def test_foo(my_f): pass') == ['my_fixture']
+    assert indexed_paths == set()
+
+    conftest.write_text('import pytest\n\n@pytest.fixture\ndef my_other_fixture():\n    return 1\n')
+    os.utime(conftest, (2, 2))
+    assert complete('def test_foo(my_): pass') == ['my_other_fixture']
+    assert str(conftest) in indexed_paths
+
+
+def test_entry_point_plugin(Script, tmp_path):
+    site_packages = tmp_path.joinpath('site-packages')
+    site_packages.mkdir()
+    project_path = tmp_path.joinpath('project')
+    project = Project(project_path, added_sys_path=[str(site_packages)])
+
+    def complete(code):
+        script = Script(code, path=project_path.joinpath('test_foo.py'), project=project)
+        return [c.name for c in script.complete(1, code.index(')'))]
+
+    assert complete('def test_foo(plugin_): pass') == []
+
+    # Installing a plugin modifies the folder, so it's found right away.
+    dist_info = site_packages.joinpath('my_plugin-1.0.dist-info')
+    dist_info.mkdir()
+    dist_info.joinpath('entry_points.txt').write_text(
+        '[console_scripts]\nfoo = my_plugin:main\n\n[pytest11]\nmy_plugin = my_plugin.fixtures\n'
+    )
+    site_packages.joinpath('my_plugin').mkdir()
+    site_packages.joinpath('my_plugin', '__init__.py').write_text('')
+    site_packages.joinpath('my_plugin', 'fixtures.py').write_text(
+        'import pytest\n\n@pytest.fixture\ndef plugin_fixture():\n    return 1\n'
+    )
+    os.utime(site_packages, (1, 1))
+    assert complete('def test_foo(plugin_): pass') == ['plugin_fixture']
@@ -0,0 +1,36 @@
+from jedi.inference import recursion
+
+
+def test_inference_time_limit(Script, monkeypatch):
+    code = 'def f(x): return x\ndef g(x): return f(x)\n'
+    code += ''.join('a%s = g(%s)\n' % (i, i) for i in range(10))
+    code += 'a9'
+
+    script = Script(code)
+    assert script.infer()[0].name == 'int'
+    assert not script.limit_reached
+
+    # The per function limit doesn't apply with a time budget.
+    monkeypatch.setattr(recursion, 'per_function_execution_limit', 0)
+    monkeypatch.setattr(recursion, 'inference_time_limit', 100)
+    script = Script(code)
+    assert script.infer()[0].name == 'int'
+    assert not script.limit_reached
+
+    monkeypatch.setattr(recursion, 'inference_time_limit', -1)
+    script = Script(code)
+    # The execution of g starts the budget, there's nothing left for f.
+    assert not script.infer()
+    assert script.limit_reached
+
+
+def test_inference_time_limit_per_request(Script, monkeypatch):
+    monkeypatch.setattr(recursion, 'inference_time_limit', -1)
+    script = Script('def f(x): return x\ndef g(x): return f(x)\ng(1)')
+    assert not script.infer()
+    assert script.limit_reached
+
+    # The next request gets a new budget.
+    monkeypatch.setattr(recursion, 'inference_time_limit', 100)
+    assert script.infer()[0].name == 'int'
+    assert not script.limit_reached
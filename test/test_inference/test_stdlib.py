@@ -33,6 +33,23 @@ def test_namedtuple_list(Script):
     assert completions == {'legs', 'length', 'large'}
 
 
+def test_namedtuple_module_cache(Script):
+    from jedi.plugins import stdlib
+    stdlib._parse_namedtuple.cache_clear()
+    source = dedent("""\
+        import collections
+        A = collections.namedtuple('A', 'foo bar')
+        B = collections.namedtuple('A', 'foo bar')
+        C = collections.namedtuple('C', 'foo')
+        A(1, 2).f""")
+    for code in (source, source + '\nB(1, 2).b', source + '\nC(1).f'):
+        assert len(Script(code).complete()) == 1
+    # Only A and C were parsed, everything else was cached.
+    cache_info = stdlib._parse_namedtuple.cache_info()
+    assert cache_info.misses == cache_info.currsize == 2
+    assert cache_info.hits > 0
+
+
 def test_namedtuple_content(Script):
     source = dedent("""\
         import collections
@@ -0,0 +1,48 @@
+from jedi.inference.base_value import ValueSet, NO_VALUES
+
+
+class _Value:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+def _values(n):
+    return [_Value(str(i)) for i in range(n)]
+
+
+def test_empty_value_set_is_shared():
+    assert ValueSet([]) is NO_VALUES
+    assert ValueSet.from_sets([]) is NO_VALUES
+    assert ValueSet.from_sets([NO_VALUES, []]) is NO_VALUES
+    assert NO_VALUES.filter(lambda v: True) is NO_VALUES
+
+
+def test_from_sets_and_union_reuse_sets():
+    a, b = _values(2)
+    s = ValueSet([a])
+    assert ValueSet.from_sets([NO_VALUES, s, s]) is s
+    assert s | NO_VALUES is s
+    assert NO_VALUES | s is s
+    assert s | ValueSet([a]) is s
+    assert set(s | ValueSet([b])) == {a, b}
+
+
+def test_small_and_big_sets():
+    values = _values(10)
+    for i in range(len(values)):
+        small = ValueSet(values[:i] + values[:i])
+        assert len(small) == i
+        assert set(small) == set(values[:i])
+        # Equality and hashes don't depend on the order.
+        reversed_ = ValueSet(reversed(values[:i]))
+        assert small == reversed_
+        assert hash(small) == hash(reversed_)
+        union = ValueSet(values[:i]) | ValueSet(values[i:])
+        assert union == ValueSet(values)
+        assert ValueSet.from_sets([values[:i], values[i:]]) == ValueSet(values)
+        assert small & ValueSet(values[i // 2:]) == ValueSet(values[i // 2:i])
+    assert ValueSet(values[:3]) != ValueSet(values[:4])
+    assert ValueSet(values[:3]) != ValueSet(values[1:4])
@@ -1,3 +1,5 @@
+from textwrap import dedent
+
 import pytest
 
 from jedi import settings
@@ -30,10 +32,96 @@ def test_cropped_file_size(monkeypatch, get_names, Script):
         len(code)
     )
 
-    foo, = get_names(code + code)
-    assert foo.line == 1
+    # Definitions after the cropped range are still there.
+    assert [foo.line for foo in get_names(code + code)] == [1, 2]
 
-    # It should just not crash if we are outside of the cropped range.
+    # The statement at the position is parsed as well.
     script = Script(code + code + 'Foo')
-    assert not script.infer()
+    foo, = script.infer()
+    assert foo.line == 2
     assert 'Foo' in [c.name for c in script.complete()]
+
+
+def test_cropped_file_definitions(monkeypatch, Script):
+    code = 'x = 1\n'
+    monkeypatch.setattr(settings, '_cropped_file_size', len(code))
+    code += dedent('''
+        def foo(a,
+                b):
+            return 1
+        class Bar(str):
+            def baz(self): pass
+        y = int(
+            3)
+        z = 1.0
+        ''')
+
+    script = Script(code)
+    names = script.get_names()
+    assert [(n.name, n.line) for n in names] == [
+        ('x', 1), ('foo', 3), ('Bar', 6), ('y', 8), ('z', 10)
+    ]
+    assert script.infer(3, 5)[0].type == 'function'
+    assert script.infer(6, 7)[0].type == 'class'
+    assert script.infer(8, 0)[0].name == 'int'
+    assert script.infer(10, 0)[0].name == 'float'
+
+
+def test_windowed_file(monkeypatch, Script):
+    monkeypatch.setattr(settings, '_windowed_file_size', 0)
+    code = dedent('''
+        def foo():
+            """
+        bar = 1
+            """
+            baz = 3.0
+            return baz
+
+        class Bar:
+            def baz(self):
+                return foo()
+        ''')
+
+    script = Script(code)
+    assert script.infer(6, 12)[0].name == 'float'
+    assert script.infer(11, 16)[0].type == 'function'
+    assert script.complete(7, 14)[0].name == 'baz'
+    # The string is not a statement.
+    assert not script.infer(4, 1)
+
+    names = script.get_names(all_scopes=True)
+    assert [n.name for n in names] == ['foo', 'baz', 'Bar', 'baz', 'self']
+
+
+def test_windowed_file_class_members(monkeypatch, Script):
+    code = dedent('''\
+        class Message:
+            """
+        def Fake(self): pass
+            """
+            FOO = 1
+
+            @property
+            def size(self) -> int:
+                return 1
+
+            def SerializeToString(self):
+                return b''
+
+        class Empty:
+            pass
+
+        Message().
+        ''')
+    line = code.count('\n')
+    # Windowing is off by default, so everything is parsed.
+    script = Script(code)
+    assert script._module_node.get_code() == code
+
+    monkeypatch.setattr(settings, '_windowed_file_size', 0)
+    script = Script(code)
+    names = [c.name for c in script.complete(line, 10)]
+    assert names[:3] == ['FOO', 'SerializeToString', 'size']
+    assert 'Fake' not in names
+    size, = Script(code + 'Message().size').infer(line + 1, 14)
+    assert size.name == 'int'